@@ -14,17 +14,68 @@ from config import settings
 # Import authentication
 from auth.simple_auth import SimpleAuthenticator
 from auth.authenticator import init_session_state, get_user_display_name
+from auth.roles import ROLE_APPROVER
 
 # Import database
 from database.db_manager import DatabaseManager
 from database.init_db import initialize_database
 
-# Import UI components
-from ui.user_dashboard import show_user_dashboard
-from ui.approver_dashboard import show_approver_dashboard
+# Import UI components (dashboards are imported lazily per role)
 from ui.bms_styles import load_custom_css, render_bms_header, render_bms_sidebar_header
 
 
+# Static sidebar footer
+FOOTER_HTML = (
+    "<div style='text-align: center; color: #7F8C8D; font-size: 11px;'>"
+    "Bristol Myers Squibb<br>"
+    "Organizational Spotlight<br>"
+    "v1.0.0"
+    "</div>"
+)
+
+
+@st.cache_resource(show_spinner="Initializing database...")
+def ensure_database(db_path: str) -> str:
+    """Initialize the database once per process, or bring its schema up to date."""
+    if not Path(db_path).exists():
+        initialize_database(db_path)
+    else:
+        # Throwaway manager; close its connection instead of pooling it forever
+        db_manager = DatabaseManager(db_path)
+        try:
+            db_manager.create_tables()
+        finally:
+            db_manager.close_all()
+    return db_path
+
+
+@st.cache_resource
+def get_auth() -> SimpleAuthenticator:
+    """Get the authenticator shared across reruns and sessions; it reloads users.yaml when the file changes."""
+    return SimpleAuthenticator()
+
+
+@st.cache_resource
+def get_db(db_path: str) -> DatabaseManager:
+    """Get the database manager shared across reruns and sessions."""
+    return DatabaseManager(db_path)
+
+
+@st.fragment
+def render_sidebar_user(current_user: dict, auth: SimpleAuthenticator):
+    """Render the sidebar user card and logout button as an isolated fragment."""
+    render_bms_sidebar_header(
+        current_user['name'],
+        current_user['role'],
+        current_user['email']
+    )
+
+    # Logout button
+    if st.button("Logout", type="primary"):
+        auth.logout()
+        st.rerun()
+
+
 def main():
     """Main application entry point."""
 
@@ -38,16 +89,13 @@ def main():
     init_session_state()
 
     # Initialize database if it doesn't exist
-    db_path = Path(settings.DATABASE_PATH)
-    if not db_path.exists():
-        with st.spinner("Initializing database..."):
-            initialize_database(settings.DATABASE_PATH)
+    ensure_database(settings.DATABASE_PATH)
 
-    # Initialize database manager
-    db_manager = DatabaseManager(settings.DATABASE_PATH)
+    # Get database manager
+    db_manager = get_db(settings.DATABASE_PATH)
 
-    # Initialize authenticator
-    auth = SimpleAuthenticator()
+    # Get authenticator
+    auth = get_auth()
 
     # Show BMS branded header
     render_bms_header(settings.APP_NAME, "Managing bi-monthly organizational achievements")
@@ -85,31 +133,27 @@ def main():
         st.error("Authentication error. Please try logging in again.")
         return
 
-    # Update last login time
-    db_manager.update_user_last_login(current_user['email'])
-
-    # Show user info in sidebar with BMS styling
-    render_bms_sidebar_header(
-        current_user['name'],
-        current_user['role'],
-        current_user['email']
-    )
+    # Update last login time once per login rather than on every rerun
+    if st.session_state.get('last_login_written') != current_user['email']:
+        db_manager.update_user_last_login(current_user['email'])
+        st.session_state['last_login_written'] = current_user['email']
 
-    # Logout button
-    if st.sidebar.button("Logout", type="primary"):
-        auth.logout()
-        st.rerun()
+    # Show user info and logout button in sidebar with BMS styling
+    with st.sidebar:
+        render_sidebar_user(current_user, auth)
 
     st.sidebar.markdown("---")
 
     # Route to appropriate dashboard based on role
-    if current_user['role'] == 'approver':
+    if current_user['role'] == ROLE_APPROVER:
+        from ui.approver_dashboard import show_approver_dashboard
         show_approver_dashboard(
             db_manager,
             current_user['email'],
             current_user['name']
         )
     else:  # user
+        from ui.user_dashboard import show_user_dashboard
         show_user_dashboard(
             db_manager,
             current_user['email'],
@@ -118,14 +162,7 @@ def main():
 
     # Footer
     st.sidebar.markdown("---")
-    st.sidebar.markdown(
-        "<div style='text-align: center; color: #7F8C8D; font-size: 11px;'>"
-        "Bristol Myers Squibb<br>"
-        "Organizational Spotlight<br>"
-        "v1.0.0"
-        "</div>",
-        unsafe_allow_html=True
-    )
+    st.sidebar.markdown(FOOTER_HTML, unsafe_allow_html=True)
 
 
 if __name__ == '__main__':
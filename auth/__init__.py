@@ -1,11 +1,13 @@
-"""Authentication package for Organizational Spotlight application."""
+"""Authentication package for Organizational Spotlight application.
+
+The OAuth/SSO placeholder is not re-exported here so it stays out of the
+startup import graph; import it from ``auth.oauth_handler`` when needed.
+"""
 
 from auth.authenticator import Authenticator, init_session_state, get_user_display_name
-from auth.oauth_handler import OAuthHandler
 
 __all__ = [
     'Authenticator',
     'init_session_state',
-    'get_user_display_name',
-    'OAuthHandler'
+    'get_user_display_name'
 ]
@@ -3,12 +3,36 @@ Authentication module for Streamlit application.
 Handles user login, logout, and session management.
 """
 
+import inspect
+import os
+from functools import lru_cache
 import streamlit as st
-import yaml
-from yaml.loader import SafeLoader
 from typing import Optional, Dict, Any
 import streamlit_authenticator as stauth
 
+from auth.config_loader import load_yaml_config
+from auth.roles import ROLE_APPROVER, intern_role
+
+
+# Resolve the installed streamlit-authenticator API shape once at import
+_LOGIN_PARAMS = inspect.signature(stauth.Authenticate.login).parameters
+_LOGIN_HAS_FIELDS = 'fields' in _LOGIN_PARAMS
+_LOGIN_HAS_LOCATION = 'location' in _LOGIN_PARAMS
+_LOGOUT_PARAMS = inspect.signature(stauth.Authenticate.logout).parameters
+_LOGOUT_NEEDS_BUTTON_NAME = (
+    'button_name' in _LOGOUT_PARAMS
+    and _LOGOUT_PARAMS['button_name'].default is inspect.Parameter.empty
+)
+
+# Session state keys and their initial values
+_SESSION_DEFAULTS = (
+    ('authentication_status', None),
+    ('user_email', None),
+    ('user_name', None),
+    ('user_role', None),
+    ('username', None),
+)
+
 
 class Authenticator:
     """Handles authentication for the Streamlit application."""
@@ -22,14 +46,13 @@ class Authenticator:
         """
         self.config_path = config_path
         self.config = self._load_config()
+        self.users = self.config.get('credentials', {}).get('usernames', {}) if self.config else {}
         self.authenticator = self._create_authenticator()
 
     def _load_config(self) -> Dict[str, Any]:
         """Load the authentication configuration from YAML file."""
         try:
-            with open(self.config_path, 'r') as file:
-                config = yaml.load(file, Loader=SafeLoader)
-            return config
+            return load_yaml_config(self.config_path, os.path.getmtime(self.config_path))
         except FileNotFoundError:
             st.error(f"Configuration file not found: {self.config_path}")
             return {}
@@ -60,23 +83,22 @@ class Authenticator:
             st.error("Authenticator not properly configured")
             return None, None, None
 
-        try:
-            # Try new API first (streamlit-authenticator >= 0.3.0)
+        if _LOGIN_HAS_FIELDS:
+            # New API (streamlit-authenticator >= 0.3.0)
             name, authentication_status, username = self.authenticator.login(fields={'Form name': 'Login'})
-        except TypeError:
-            try:
-                # Try older API with location parameter
-                name, authentication_status, username = self.authenticator.login(location=location)
-            except:
-                # Fallback to simplest call
-                name, authentication_status, username = self.authenticator.login()
+        elif _LOGIN_HAS_LOCATION:
+            # Older API with location parameter
+            name, authentication_status, username = self.authenticator.login(location=location)
+        else:
+            # Simplest call
+            name, authentication_status, username = self.authenticator.login()
 
         # Store user info in session state
         if authentication_status:
-            user_data = self.config['credentials']['usernames'].get(username, {})
+            user_data = self.users.get(username, {})
             st.session_state['user_email'] = user_data.get('email', username)
             st.session_state['user_name'] = name
-            st.session_state['user_role'] = user_data.get('role', 'user')
+            st.session_state['user_role'] = intern_role(user_data.get('role'))
             st.session_state['username'] = username
             st.session_state['authentication_status'] = True
         elif authentication_status is False:
@@ -94,15 +116,11 @@ class Authenticator:
             location: Where to display the logout button ('main' or 'sidebar')
         """
         if self.authenticator:
-            try:
-                # Try new API
+            if _LOGOUT_NEEDS_BUTTON_NAME:
+                # Older API (< 0.3.0) requires a button name
+                self.authenticator.logout('Logout', location)
+            else:
                 self.authenticator.logout()
-            except TypeError:
-                try:
-                    # Try with location parameter
-                    self.authenticator.logout(location=location)
-                except:
-                    pass
 
         # Clear session state
         st.session_state['authentication_status'] = None
@@ -137,7 +155,7 @@ class Authenticator:
 
     def is_approver(self) -> bool:
         """Check if current user has approver role."""
-        return st.session_state.get('user_role') == 'approver'
+        return st.session_state.get('user_role') == ROLE_APPROVER
 
     def require_authentication(self):
         """Require authentication, show login if not authenticated."""
@@ -161,20 +179,21 @@ class Authenticator:
 
 def init_session_state():
     """Initialize session state variables."""
-    if 'authentication_status' not in st.session_state:
-        st.session_state['authentication_status'] = None
+    if '_spotlight_init' in st.session_state:
+        return
 
-    if 'user_email' not in st.session_state:
-        st.session_state['user_email'] = None
+    for key, value in _SESSION_DEFAULTS:
+        st.session_state.setdefault(key, value)
 
-    if 'user_name' not in st.session_state:
-        st.session_state['user_name'] = None
+    st.session_state['_spotlight_init'] = True
 
-    if 'user_role' not in st.session_state:
-        st.session_state['user_role'] = None
 
-    if 'username' not in st.session_state:
-        st.session_state['username'] = None
+@lru_cache(maxsize=256)
+def _format_display_name(name: str, role: str) -> str:
+    """Format a display name as 'Name (Role)'."""
+    if role:
+        return f"{name} ({role.title()})"
+    return name
 
 
 def get_user_display_name() -> str:
@@ -182,6 +201,4 @@ def get_user_display_name() -> str:
     name = st.session_state.get('user_name', 'User')
     role = st.session_state.get('user_role', '')
 
-    if role:
-        return f"{name} ({role.title()})"
-    return name
+    return _format_display_name(name, role)
@@ -0,0 +1,43 @@
+"""
+Shared loader for the authentication configuration file.
+"""
+
+import hashlib
+import streamlit as st
+import yaml
+from typing import Any, Dict, Optional, Tuple
+
+# Prefer the LibYAML-backed loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+# Digest of the raw bytes last parsed and the result, so an mtime bump
+# without a content change (e.g. `touch`) skips the YAML parse
+_last_parsed: Tuple[Optional[bytes], Optional[Dict[str, Any]]] = (None, None)
+
+
+@st.cache_data(show_spinner=False)
+def load_yaml_config(path: str, mtime: float) -> Dict[str, Any]:
+    """
+    Parse a YAML file, cached across reruns and sessions.
+
+    Args:
+        path: Path to the YAML file
+        mtime: File modification time; only used to invalidate the cache
+
+    Returns:
+        Parsed configuration dictionary
+    """
+    with open(path, 'rb') as file:
+        raw = file.read()
+
+    global _last_parsed
+    digest = hashlib.blake2b(raw, digest_size=16).digest()
+    last_digest, config = _last_parsed
+    if digest != last_digest:
+        config = yaml.load(raw, Loader=SafeLoader)
+        _last_parsed = (digest, config)
+    return config
@@ -0,0 +1,15 @@
+"""
+User role constants.
+Roles are interned so equality checks usually short-circuit on identity;
+role checks use ==, so nothing depends on a role having been interned.
+"""
+
+import sys
+
+ROLE_USER = sys.intern('user')
+ROLE_APPROVER = sys.intern('approver')
+
+
+def intern_role(role: str) -> str:
+    """Return the interned role string, defaulting to the user role."""
+    return sys.intern(role) if role else ROLE_USER
@@ -3,11 +3,14 @@ Simple authentication module without external dependencies.
 Uses basic username/password authentication with session state.
 """
 
+import os
 import streamlit as st
-import yaml
-from yaml.loader import SafeLoader
 from typing import Optional, Dict, Any
 import hashlib
+import hmac
+
+from auth.config_loader import load_yaml_config
+from auth.roles import ROLE_APPROVER, intern_role
 
 
 class SimpleAuthenticator:
@@ -16,41 +19,62 @@ class SimpleAuthenticator:
     def __init__(self, config_path: str = 'config/users.yaml'):
         """Initialize the authenticator."""
         self.config_path = config_path
-        self.config = self._load_config()
+        self._config_mtime = None
+        self.config = {}
+        self.users = {}
+        self._pwhash = {}
+        self._refresh_config()
 
     def _load_config(self) -> Dict[str, Any]:
         """Load the authentication configuration from YAML file."""
         try:
-            with open(self.config_path, 'r') as file:
-                config = yaml.load(file, Loader=SafeLoader)
-            return config
+            return load_yaml_config(self.config_path, os.path.getmtime(self.config_path))
         except FileNotFoundError:
             st.error(f"Configuration file not found: {self.config_path}")
             return {}
 
-    def _hash_password(self, password: str) -> str:
-        """Hash a password using SHA256."""
-        return hashlib.sha256(password.encode()).hexdigest()
+    def _refresh_config(self):
+        """
+        Reload the configuration if the YAML file changed since it was last read.
 
-    def _verify_password(self, username: str, password: str) -> bool:
-        """Verify username and password."""
-        if not self.config:
-            return False
+        The authenticator is shared across sessions for the life of the process,
+        so edits to the users file are picked up here rather than at startup.
+        A missing file is retried on every call.
+        """
+        try:
+            mtime = os.path.getmtime(self.config_path)
+        except FileNotFoundError:
+            mtime = None
 
-        users = self.config.get('credentials', {}).get('usernames', {})
+        if mtime is not None and mtime == self._config_mtime:
+            return
 
-        if username not in users:
-            return False
+        config = self._load_config()
+        users = config.get('credentials', {}).get('usernames', {}) if config else {}
+        self.config = config
+        self.users = users
+        self._pwhash = self._build_password_hashes()
+        self._config_mtime = mtime
+
+    def _hash_password(self, password: str) -> bytes:
+        """Hash a password using SHA256, as raw digest bytes."""
+        return hashlib.sha256(password.encode()).digest()
 
-        stored_password = users[username].get('password', '')
+    def _build_password_hashes(self) -> Dict[str, bytes]:
+        """Precompute SHA256 digests of the configured user passwords."""
+        return {
+            username: bytes.fromhex(user_data['password_sha256'])
+            for username, user_data in self.users.items()
+            if user_data.get('password_sha256')
+        }
 
-        # For demo, we'll use simple comparison
-        # In production, use proper password hashing
-        # For now, accept the plain password "password123" for all users
-        if password == 'password123':
-            return True
+    def _verify_password(self, username: str, password: str) -> bool:
+        """Verify username and password."""
+        stored_digest = self._pwhash.get(username)
+        if stored_digest is None:
+            return False
 
-        return False
+        return hmac.compare_digest(self._hash_password(password), stored_digest)
 
     def login(self) -> tuple:
         """
@@ -59,6 +83,8 @@ class SimpleAuthenticator:
         Returns:
             Tuple of (name, authentication_status, username)
         """
+        self._refresh_config()
+
         if not self.config:
             st.error("Authenticator not properly configured")
             return None, False, None
@@ -66,8 +92,7 @@ class SimpleAuthenticator:
         # Check if already authenticated
         if st.session_state.get('authentication_status'):
             username = st.session_state.get('username')
-            users = self.config.get('credentials', {}).get('usernames', {})
-            name = users.get(username, {}).get('name', username)
+            name = self.users.get(username, {}).get('name', username)
             return name, True, username
 
         # Display login form
@@ -79,13 +104,12 @@ class SimpleAuthenticator:
             if submit:
                 if self._verify_password(username, password):
                     # Authentication successful
-                    users = self.config.get('credentials', {}).get('usernames', {})
-                    user_data = users.get(username, {})
+                    user_data = self.users.get(username, {})
 
                     st.session_state['authentication_status'] = True
                     st.session_state['user_email'] = user_data.get('email', username)
                     st.session_state['user_name'] = user_data.get('name', username)
-                    st.session_state['user_role'] = user_data.get('role', 'user')
+                    st.session_state['user_role'] = intern_role(user_data.get('role'))
                     st.session_state['username'] = username
 
                     st.success('Login successful!')
@@ -122,4 +146,4 @@ class SimpleAuthenticator:
 
     def is_approver(self) -> bool:
         """Check if current user has approver role."""
-        return st.session_state.get('user_role') == 'approver'
+        return st.session_state.get('user_role') == ROLE_APPROVER
@@ -2,8 +2,11 @@
 Bristol Myers Squibb branding configuration.
 """
 
+from types import MappingProxyType
+
+
 # BMS Brand Colors
-BMS_COLORS = {
+BMS_COLORS = MappingProxyType({
     'primary': '#BE2BBB',      # BMS Purple - main brand color
     'primary_dark': '#9B2399',  # Darker shade for hover states
     'primary_light': '#D666D4', # Lighter shade for backgrounds
@@ -18,10 +21,10 @@ BMS_COLORS = {
     'background': '#FFFFFF',    # White background
     'background_alt': '#F8F9FA', # Light grey background
     'border': '#E0E0E0',        # Border color
-}
+})
 
 # Status badge colors
-STATUS_COLORS = {
+STATUS_COLORS = MappingProxyType({
     'draft': '#6c757d',
     'submitted': '#0066CC',
     'under_review': '#FF6B35',
@@ -29,15 +32,15 @@ STATUS_COLORS = {
     'rejected': '#DC143C',
     'published': '#BE2BBB',
     'open': '#00A758'
-}
+})
 
 # Typography
-FONTS = {
+FONTS = MappingProxyType({
     'regular': 'BMSRegular, Arial, sans-serif',
     'bold': 'BMSBold, Arial, sans-serif',
     'heading': 'BMSBold, Arial, sans-serif',
     'body': 'BMSRegular, Arial, sans-serif',
-}
+})
 
 # Logo configuration
 LOGO_PATH = 'assets/bms.png'
@@ -2,11 +2,25 @@
 Application configuration and settings.
 """
 
+import json
 import os
-from dotenv import load_dotenv
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping, Tuple
+
+
+def _load_env_file():
+    """Load variables from .env unless the platform already provides them."""
+    if os.getenv('DOTENV_SKIP') == '1':
+        return
+
+    from dotenv import load_dotenv
+    load_dotenv()
+
 
 # Load environment variables
-load_dotenv()
+_load_env_file()
 
 
 # Application settings
@@ -31,89 +45,85 @@ OAUTH_CLIENT_ID = os.getenv('OAUTH_CLIENT_ID')
 OAUTH_CLIENT_SECRET = os.getenv('OAUTH_CLIENT_SECRET')
 OAUTH_REDIRECT_URI = os.getenv('OAUTH_REDIRECT_URI', 'http://localhost:8501/oauth/callback')
 
-# Form field configuration
+# Form field configuration lives in form_fields.json
 # This can be customized based on user requirements
-FORM_FIELDS = [
-    {
-        'name': 'title',
-        'label': 'Spotlight Title',
-        'type': 'text',
-        'required': True,
-        'placeholder': 'Enter a compelling title for your spotlight',
-        'help_text': 'A brief, attention-grabbing title (50-80 characters recommended)'
-    },
-    {
-        'name': 'description',
-        'label': 'Description',
-        'type': 'textarea',
-        'required': True,
-        'placeholder': 'Describe what this spotlight is about',
-        'help_text': 'Provide context and background (2-3 sentences)'
-    },
-    {
-        'name': 'key_achievements',
-        'label': 'Key Achievements',
-        'type': 'textarea',
-        'required': True,
-        'placeholder': 'List the main accomplishments',
-        'help_text': 'Highlight the most important achievements and milestones'
-    },
-    {
-        'name': 'impact',
-        'label': 'Impact & Results',
-        'type': 'textarea',
-        'required': True,
-        'placeholder': 'Describe the impact and measurable results',
-        'help_text': 'Include metrics, outcomes, and business value delivered'
-    },
-    {
-        'name': 'category',
-        'label': 'Category',
-        'type': 'select',
-        'required': True,
-        'options': [
-            'Innovation',
-            'Process Improvement',
-            'Customer Success',
-            'Team Achievement',
-            'Technology Advancement',
-            'Business Growth',
-            'Other'
-        ],
-        'help_text': 'Select the category that best fits this spotlight'
-    },
-    {
-        'name': 'tags',
-        'label': 'Tags',
-        'type': 'multiselect',
-        'required': False,
-        'options': [
-            'Digital Transformation',
-            'AI/ML',
-            'Cloud',
-            'Security',
-            'Data Analytics',
-            'Automation',
-            'Collaboration',
-            'Customer Experience',
-            'Efficiency',
-            'Cost Savings'
-        ],
-        'help_text': 'Select relevant tags (optional)'
-    },
-    {
-        'name': 'team_members',
-        'label': 'Team Members',
-        'type': 'text',
-        'required': False,
-        'placeholder': 'Names of key contributors (comma-separated)',
-        'help_text': 'Recognize team members who contributed to this achievement'
-    }
-]
+_FORM_FIELDS_PATH = Path(__file__).parent / 'form_fields.json'
+
+
+def _freeze(value: Any) -> Any:
+    """Make parsed JSON read-only: objects become mappingproxies, arrays tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@lru_cache(maxsize=1)
+def get_form_fields() -> Tuple[Mapping[str, Any], ...]:
+    """
+    Load the submission form field definitions.
+
+    The JSON file is parsed on first use and cached for the process. The
+    result is shared by every caller, so it is returned read-only.
+
+    Returns:
+        Tuple of read-only field definition mappings
+    """
+    with open(_FORM_FIELDS_PATH, encoding='utf-8') as f:
+        return _freeze(json.load(f))
+
+
+@lru_cache(maxsize=1)
+def get_form_fields_by_name() -> Mapping[str, Mapping[str, Any]]:
+    """
+    Index the form field definitions by field name.
+
+    Each definition also carries an ``_options_set`` frozenset so validators
+    can check select values without scanning the options list.
+
+    Returns:
+        Read-only ordered mapping of field name to field definition
+    """
+    return MappingProxyType({
+        field['name']: MappingProxyType({**field, '_options_set': frozenset(field.get('options', ()))})
+        for field in get_form_fields()
+    })
+
+
+def __getattr__(name: str) -> Any:
+    # FORM_FIELDS was a module constant before form_fields.json; keep it
+    # importable without loading the file at import time
+    if name == 'FORM_FIELDS':
+        return get_form_fields()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Project names configuration
 # Set to None to use manual text input only
 PROJECT_NAMES = None  # Manual population only
+PROJECT_NAMES_SET = frozenset(PROJECT_NAMES) if PROJECT_NAMES is not None else None
+
+
+@lru_cache(maxsize=1)
+def get_submission_fields_by_name() -> Mapping[str, Mapping[str, Any]]:
+    """
+    Index the form fields plus the project name, for validating a full submission.
+
+    Returns:
+        Read-only ordered mapping of field name to field definition, project name last
+    """
+    return MappingProxyType({
+        **get_form_fields_by_name(),
+        'project_name': MappingProxyType({
+            'name': 'project_name',
+            'label': 'Project name',
+            'type': 'project',
+            'required': True,
+            '_options_set': PROJECT_NAMES_SET,
+        }),
+    })
+
 
 # Email recipients configuration
 # Can be a list of email addresses or groups
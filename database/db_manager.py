@@ -5,121 +5,507 @@ Handles all database operations using SQLite.
 
 import sqlite3
 import json
+import queue
+import threading
+import time
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from contextlib import contextmanager
+from dataclasses import replace
+from functools import lru_cache
 
+from config import settings
 from database.models import (
     Publication, Submission, SubmissionField, AISuggestion, User
 )
 
 
+# Store datetimes as ISO text and parse TIMESTAMP columns back while rows
+# are fetched, so row mapping doesn't have to
+sqlite3.register_adapter(datetime, lambda dt: dt.isoformat(' '))
+sqlite3.register_converter('TIMESTAMP', lambda raw: datetime.fromisoformat(raw.decode()))
+
+# Seconds the active publication lookup is cached for
+_ACTIVE_PUBLICATION_TTL = 60
+
+# Applied once to every new connection
+_CONNECTION_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-65536',
+    'PRAGMA mmap_size=268435456',
+)
+
+# Full schema; executescript commits any open transaction before running,
+# so the script reopens one for create_tables to commit
+_SQL_SCHEMA = '''
+    BEGIN;
+
+    -- Publications table
+    CREATE TABLE IF NOT EXISTS publications (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        year INTEGER NOT NULL,
+        month INTEGER NOT NULL,
+        period TEXT NOT NULL,
+        status TEXT NOT NULL DEFAULT 'open',
+        created_at TIMESTAMP NOT NULL,
+        published_at TIMESTAMP,
+        UNIQUE(year, month, period)
+    );
+
+    -- Submissions table
+    CREATE TABLE IF NOT EXISTS submissions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        publication_id INTEGER NOT NULL,
+        user_email TEXT NOT NULL,
+        project_name TEXT NOT NULL,
+        status TEXT NOT NULL DEFAULT 'draft',
+        created_at TIMESTAMP NOT NULL,
+        updated_at TIMESTAMP NOT NULL,
+        submitted_at TIMESTAMP,
+        reviewed_by TEXT,
+        reviewed_at TIMESTAMP,
+        fields_json TEXT,
+        FOREIGN KEY (publication_id) REFERENCES publications(id)
+    );
+
+    -- Submission fields table
+    CREATE TABLE IF NOT EXISTS submission_fields (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        submission_id INTEGER NOT NULL,
+        field_name TEXT NOT NULL,
+        field_value TEXT NOT NULL,
+        created_at TIMESTAMP NOT NULL,
+        FOREIGN KEY (submission_id) REFERENCES submissions(id)
+    );
+
+    -- AI suggestions table
+    CREATE TABLE IF NOT EXISTS ai_suggestions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        submission_id INTEGER NOT NULL,
+        original_content TEXT NOT NULL,
+        suggested_content TEXT NOT NULL,
+        accepted INTEGER NOT NULL DEFAULT 0,
+        created_at TIMESTAMP NOT NULL,
+        FOREIGN KEY (submission_id) REFERENCES submissions(id)
+    );
+
+    -- Users table
+    CREATE TABLE IF NOT EXISTS users (
+        email TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        role TEXT NOT NULL,
+        created_at TIMESTAMP NOT NULL,
+        last_login TIMESTAMP
+    );
+
+    -- Indexes for submission lookups; publications by cycle are already
+    -- covered by the UNIQUE(year, month, period) index
+    CREATE INDEX IF NOT EXISTS idx_sub_pub_status
+    ON submissions(publication_id, status, created_at DESC);
+
+    CREATE INDEX IF NOT EXISTS idx_sub_user
+    ON submissions(user_email, created_at DESC);
+
+    CREATE INDEX IF NOT EXISTS idx_fields_sub
+    ON submission_fields(submission_id);
+
+    CREATE INDEX IF NOT EXISTS idx_ai_sub
+    ON ai_suggestions(submission_id, created_at DESC);
+
+    CREATE INDEX IF NOT EXISTS idx_pub_status
+    ON publications(status, year, month);
+'''
+
+# SQL statements, kept at module level and reused by the methods below
+_SQL_INSERT_PUBLICATION = '''
+    INSERT INTO publications (year, month, period, status, created_at)
+    VALUES (?, ?, ?, 'open', ?)
+'''
+
+_SQL_INSERT_PUBLICATION_IF_MISSING = '''
+    INSERT OR IGNORE INTO publications (year, month, period, status, created_at)
+    VALUES (?, ?, ?, 'open', ?)
+'''
+
+_SQL_GET_PUBLICATION = 'SELECT * FROM publications WHERE id = ?'
+
+_SQL_GET_PUBLICATIONS_BY_YEAR = '''
+    SELECT * FROM publications
+    WHERE year = ?
+    ORDER BY year DESC, month DESC, period
+'''
+
+_SQL_GET_ALL_PUBLICATIONS = '''
+    SELECT * FROM publications
+    ORDER BY year DESC, month DESC, period
+'''
+
+_SQL_GET_ACTIVE_PUBLICATION = '''
+    SELECT * FROM publications
+    WHERE year = ? AND month = ? AND period = ? AND status = 'open'
+'''
+
+_SQL_GET_UPCOMING_OPEN_PUBLICATIONS = '''
+    SELECT * FROM publications
+    WHERE status = 'open' AND (year > ? OR (year = ? AND month >= ?))
+    ORDER BY year, month, period
+    LIMIT ?
+'''
+
+# A NULL year matches every year; a negative LIMIT means no limit
+_SQL_GET_PUBLICATIONS_BY_STATUS = '''
+    SELECT * FROM publications
+    WHERE status = ? AND (? IS NULL OR year = ?)
+    ORDER BY year DESC, month DESC, period
+    LIMIT ?
+'''
+
+_SQL_PUBLISH_PUBLICATION = '''
+    UPDATE publications
+    SET status = ?, published_at = ?
+    WHERE id = ?
+'''
+
+_SQL_UPDATE_PUBLICATION_STATUS = '''
+    UPDATE publications
+    SET status = ?
+    WHERE id = ?
+'''
+
+_SQL_INSERT_SUBMISSION = '''
+    INSERT INTO submissions
+    (publication_id, user_email, project_name, status, fields_json, created_at, updated_at, submitted_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_INSERT_FIELD = '''
+    INSERT INTO submission_fields
+    (submission_id, field_name, field_value, created_at)
+    VALUES (?, ?, ?, ?)
+'''
+
+_SQL_GET_SUBMISSION = 'SELECT * FROM submissions WHERE id = ?'
+
+# Rows written before fields_json existed fall back to submission_fields;
+# legacy_fields flags those, since their values are all stored as text
+_FIELDS_JSON_EXPR = '''
+    COALESCE(s.fields_json,
+             (SELECT json_group_object(field_name, field_value)
+              FROM submission_fields
+              WHERE submission_id = s.id)) AS all_fields,
+    s.fields_json IS NULL AS legacy_fields'''
+
+_SQL_GET_SUBMISSION_FIELDS = f'''
+    SELECT {_FIELDS_JSON_EXPR}
+    FROM submissions s
+    WHERE s.id = ?
+'''
+
+# Formatted with one placeholder per submission ID
+_SQL_GET_SUBMISSION_FIELDS_BULK = f'''
+    SELECT s.id, {_FIELDS_JSON_EXPR}
+    FROM submissions s
+    WHERE s.id IN ({{placeholders}})
+'''
+
+_SQL_GET_SUBMISSION_WITH_FIELDS = f'''
+    SELECT s.*, {_FIELDS_JSON_EXPR}
+    FROM submissions s
+    WHERE s.id = ?
+'''
+
+_SQL_GET_SUBMISSIONS_BY_PUBLICATION_STATUS = '''
+    SELECT * FROM submissions
+    WHERE publication_id = ? AND status = ?
+    ORDER BY created_at DESC
+'''
+
+_SQL_GET_SUBMISSIONS_BY_PUBLICATION = '''
+    SELECT * FROM submissions
+    WHERE publication_id = ?
+    ORDER BY created_at DESC
+'''
+
+_SQL_GET_SUBMISSIONS_BY_USER = '''
+    SELECT * FROM submissions
+    WHERE user_email = ?
+    ORDER BY created_at DESC
+'''
+
+_SQL_GET_USER_SUBMISSIONS_WITH_DETAILS = f'''
+    SELECT s.*, {_FIELDS_JSON_EXPR},
+           p.year AS pub_year, p.month AS pub_month, p.period AS pub_period,
+           p.status AS pub_status, p.created_at AS pub_created_at,
+           p.published_at AS pub_published_at
+    FROM submissions s
+    JOIN publications p ON p.id = s.publication_id
+    WHERE s.user_email = ?
+    ORDER BY s.created_at DESC
+'''
+
+_SQL_COUNT_SUBMISSIONS_BY_STATUS = '''
+    SELECT status, COUNT(*) AS n
+    FROM submissions
+    WHERE publication_id = ?
+    GROUP BY status
+'''
+
+_SQL_COUNT_SUBMISSIONS_BY_STATUS_FOR_YEAR = '''
+    SELECT s.publication_id, s.status, COUNT(*) AS n
+    FROM submissions s
+    JOIN publications p ON p.id = s.publication_id
+    WHERE p.year = ?
+    GROUP BY s.publication_id, s.status
+'''
+
+_SQL_COUNT_SUBMISSIONS_PER_PUBLICATION = '''
+    SELECT publication_id, COUNT(*) AS n
+    FROM submissions
+    WHERE status = ?
+    GROUP BY publication_id
+'''
+
+# Formatted with one placeholder per status being probed
+_SQL_SUBMISSION_EXISTS = '''
+    SELECT 1 FROM submissions
+    WHERE publication_id = ? AND status IN ({placeholders})
+    LIMIT 1
+'''
+
+_SQL_MARK_SUBMISSION_SUBMITTED = '''
+    UPDATE submissions
+    SET status = ?, submitted_at = ?, updated_at = ?
+    WHERE id = ?
+'''
+
+_SQL_MARK_SUBMISSION_REVIEWED = '''
+    UPDATE submissions
+    SET status = ?, reviewed_by = ?, reviewed_at = ?, updated_at = ?
+    WHERE id = ?
+'''
+
+_SQL_UPDATE_SUBMISSION_STATUS = '''
+    UPDATE submissions
+    SET status = ?, updated_at = ?
+    WHERE id = ?
+'''
+
+_SQL_DELETE_SUBMISSION_FIELDS = 'DELETE FROM submission_fields WHERE submission_id = ?'
+
+_SQL_UPDATE_SUBMISSION_FIELDS_JSON = '''
+    UPDATE submissions
+    SET fields_json = ?, updated_at = ?
+    WHERE id = ?
+'''
+
+_SQL_INSERT_AI_SUGGESTION = '''
+    INSERT INTO ai_suggestions
+    (submission_id, original_content, suggested_content, accepted, created_at)
+    VALUES (?, ?, ?, ?, ?)
+'''
+
+_SQL_GET_AI_SUGGESTIONS = '''
+    SELECT * FROM ai_suggestions
+    WHERE submission_id = ?
+    ORDER BY created_at DESC
+'''
+
+_SQL_UPDATE_AI_SUGGESTION_ACCEPTED = '''
+    UPDATE ai_suggestions
+    SET accepted = ?
+    WHERE id = ?
+'''
+
+_SQL_INSERT_USER = '''
+    INSERT INTO users (email, name, role, created_at)
+    VALUES (?, ?, ?, ?)
+'''
+
+_SQL_INSERT_USER_IF_MISSING = '''
+    INSERT OR IGNORE INTO users (email, name, role, created_at)
+    VALUES (?, ?, ?, ?)
+'''
+
+_SQL_GET_USER = 'SELECT * FROM users WHERE email = ?'
+
+_SQL_UPDATE_USER_LAST_LOGIN = '''
+    UPDATE users
+    SET last_login = ?
+    WHERE email = ?
+'''
+
+
+# Field value converters by exact type; lists become JSON arrays for SQLite
+# storage and strings pass through untouched
+_FIELD_COERCERS = {
+    list: json.dumps,
+    str: lambda value: value,
+}
+
+
+def _coerce_field_value(value: Any) -> str:
+    """Convert a field value to its SQLite storage form."""
+    return _FIELD_COERCERS.get(type(value), str)(value)
+
+
+def _decode_field_value(value: Optional[str]) -> Any:
+    """Convert a stored field value back, decoding JSON-encoded lists."""
+    if isinstance(value, str) and value[:1] == '[':
+        try:
+            decoded = json.loads(value)
+        except ValueError:
+            return value
+        if isinstance(decoded, list):
+            return decoded
+    return value
+
+
+@lru_cache(maxsize=1)
+def _multiselect_field_names() -> frozenset:
+    """Names of configured multiselect fields, whose legacy rows hold JSON lists."""
+    return frozenset(
+        field['name'] for field in settings.get_form_fields()
+        if field.get('type') == 'multiselect'
+    )
+
+
+def _encode_fields(fields: Dict[str, Any]) -> str:
+    """Serialize submission fields for the submissions.fields_json column."""
+    return json.dumps({
+        name: value if isinstance(value, list) else _coerce_field_value(value)
+        for name, value in fields.items()
+    })
+
+
+def _decode_fields(fields_json: Optional[str], legacy: bool = False) -> Dict[str, Any]:
+    """
+    Parse the fields document of a submission row.
+
+    Args:
+        fields_json: JSON object of field name to value
+        legacy: Whether the object was built from submission_fields rows, where
+            multiselect values are stored as JSON-encoded text
+
+    Returns:
+        Dictionary of field values
+    """
+    if not fields_json:
+        return {}
+    fields = json.loads(fields_json)
+    if legacy:
+        for name in _multiselect_field_names().intersection(fields):
+            fields[name] = _decode_field_value(fields[name])
+    return fields
+
+
+def _row_fields(row: sqlite3.Row) -> Dict[str, Any]:
+    """Decode the fields selected through _FIELDS_JSON_EXPR."""
+    return _decode_fields(row['all_fields'], row['legacy_fields'])
+
+
 class DatabaseManager:
     """Manages database connections and operations."""
 
     def __init__(self, db_path: str):
         """Initialize the database manager."""
         self.db_path = db_path
+        # Idle connections, reused across calls and threads
+        self._pool = queue.LifoQueue()
+        # Connection currently checked out by this thread, if any
+        self._local = threading.local()
+        # Active publication per (year, month, period) and TTL bucket; cleared on
+        # publication writes made through this manager
+        self._get_active_publication_cached = lru_cache(maxsize=4)(self._query_active_publication)
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open a new connection in autocommit mode; transactions are explicit."""
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            cached_statements=256
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
 
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Context manager for a pooled connection wrapped in a transaction."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            # Nested use on the same thread joins the outer transaction
+            yield conn
+            return
+
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = self._open_connection()
+
+        self._local.conn = conn
+        self._local.now = datetime.now()
         try:
+            conn.execute('BEGIN')
             yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
+            conn.execute('COMMIT')
         finally:
+            # Also covers BaseException exits such as Streamlit's rerun and
+            # stop signals, so no connection returns to the pool mid-transaction
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+            self._local.conn = None
+            self._pool.put(conn)
+
+    def _now(self) -> datetime:
+        """Timestamp shared by every write in the current transaction."""
+        return self._local.now
+
+    def transaction(self):
+        """
+        Group several operations into a single commit.
+
+        Manager methods called inside the block on the same thread join its
+        transaction, and everything is rolled back if the block raises.
+
+        Returns:
+            Context manager yielding the shared connection
+        """
+        return self.get_connection()
+
+    def close_all(self):
+        """Close all idle pooled connections."""
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
             conn.close()
 
     def create_tables(self):
         """Create all database tables."""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-
-            # Publications table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS publications (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    year INTEGER NOT NULL,
-                    month INTEGER NOT NULL,
-                    period TEXT NOT NULL,
-                    status TEXT NOT NULL DEFAULT 'open',
-                    created_at TIMESTAMP NOT NULL,
-                    published_at TIMESTAMP,
-                    UNIQUE(year, month, period)
-                )
-            ''')
-
-            # Submissions table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS submissions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    publication_id INTEGER NOT NULL,
-                    user_email TEXT NOT NULL,
-                    project_name TEXT NOT NULL,
-                    status TEXT NOT NULL DEFAULT 'draft',
-                    created_at TIMESTAMP NOT NULL,
-                    updated_at TIMESTAMP NOT NULL,
-                    submitted_at TIMESTAMP,
-                    reviewed_by TEXT,
-                    reviewed_at TIMESTAMP,
-                    FOREIGN KEY (publication_id) REFERENCES publications(id)
-                )
-            ''')
-
-            # Submission fields table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS submission_fields (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    submission_id INTEGER NOT NULL,
-                    field_name TEXT NOT NULL,
-                    field_value TEXT NOT NULL,
-                    created_at TIMESTAMP NOT NULL,
-                    FOREIGN KEY (submission_id) REFERENCES submissions(id)
-                )
-            ''')
-
-            # AI suggestions table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS ai_suggestions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    submission_id INTEGER NOT NULL,
-                    original_content TEXT NOT NULL,
-                    suggested_content TEXT NOT NULL,
-                    accepted INTEGER NOT NULL DEFAULT 0,
-                    created_at TIMESTAMP NOT NULL,
-                    FOREIGN KEY (submission_id) REFERENCES submissions(id)
-                )
-            ''')
-
-            # Users table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS users (
-                    email TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    role TEXT NOT NULL,
-                    created_at TIMESTAMP NOT NULL,
-                    last_login TIMESTAMP
-                )
-            ''')
+            conn.executescript(_SQL_SCHEMA)
+
+            # Databases created before fields_json was added
+            columns = {row['name'] for row in conn.execute('PRAGMA table_info(submissions)')}
+            if 'fields_json' not in columns:
+                conn.execute('ALTER TABLE submissions ADD COLUMN fields_json TEXT')
 
     # Publication CRUD operations
     def create_publication(self, year: int, month: int, period: str) -> Publication:
         """Create a new publication."""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            created_at = datetime.now()
+            created_at = self._now()
 
-            cursor.execute('''
-                INSERT INTO publications (year, month, period, status, created_at)
-                VALUES (?, ?, ?, 'open', ?)
-            ''', (year, month, period, created_at))
+            cursor = conn.execute(_SQL_INSERT_PUBLICATION, (year, month, period, created_at))
 
             pub_id = cursor.lastrowid
+            self._get_active_publication_cached.cache_clear()
 
             return Publication(
                 id=pub_id,
@@ -130,301 +516,336 @@ class DatabaseManager:
                 created_at=created_at
             )
 
+    def create_publications_bulk(self, periods: List[Tuple[int, int, str]]) -> int:
+        """
+        Create publications in one transaction, skipping ones that already exist.
+
+        Args:
+            periods: List of (year, month, period) tuples
+
+        Returns:
+            Number of publications created
+        """
+        with self.get_connection() as conn:
+            created_at = self._now()
+
+            cursor = conn.executemany(_SQL_INSERT_PUBLICATION_IF_MISSING, [
+                (year, month, period, created_at) for year, month, period in periods
+            ])
+
+            self._get_active_publication_cached.cache_clear()
+            return cursor.rowcount
+
     def get_publication(self, pub_id: int) -> Optional[Publication]:
         """Get a publication by ID."""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('SELECT * FROM publications WHERE id = ?', (pub_id,))
-            row = cursor.fetchone()
+            row = conn.execute(_SQL_GET_PUBLICATION, (pub_id,)).fetchone()
 
             if row:
-                return Publication(
-                    id=row['id'],
-                    year=row['year'],
-                    month=row['month'],
-                    period=row['period'],
-                    status=row['status'],
-                    created_at=datetime.fromisoformat(row['created_at']),
-                    published_at=datetime.fromisoformat(row['published_at']) if row['published_at'] else None
-                )
+                return Publication.from_row(row)
             return None
 
     def get_all_publications(self, year: Optional[int] = None) -> List[Publication]:
         """Get all publications, optionally filtered by year."""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-
             if year:
-                cursor.execute(
-                    'SELECT * FROM publications WHERE year = ? ORDER BY year DESC, month DESC, period',
-                    (year,)
-                )
+                cursor = conn.execute(_SQL_GET_PUBLICATIONS_BY_YEAR, (year,))
             else:
-                cursor.execute('SELECT * FROM publications ORDER BY year DESC, month DESC, period')
-
-            rows = cursor.fetchall()
-            publications = []
+                cursor = conn.execute(_SQL_GET_ALL_PUBLICATIONS)
 
-            for row in rows:
-                publications.append(Publication(
-                    id=row['id'],
-                    year=row['year'],
-                    month=row['month'],
-                    period=row['period'],
-                    status=row['status'],
-                    created_at=datetime.fromisoformat(row['created_at']),
-                    published_at=datetime.fromisoformat(row['published_at']) if row['published_at'] else None
-                ))
-
-            return publications
+            return [Publication.from_row(row) for row in cursor]
 
     def get_active_publication(self) -> Optional[Publication]:
         """Get the currently active (open) publication based on current date."""
         now = datetime.now()
-        year = now.year
-        month = now.month
-        day = now.day
+        period = 'first_half' if now.day <= 15 else 'second_half'
 
-        period = 'first_half' if day <= 15 else 'second_half'
+        # The time bucket expires entries, so writes from other processes
+        # (e.g. database.init_db) show up within the TTL
+        bucket = int(time.monotonic() // _ACTIVE_PUBLICATION_TTL)
+        publication = self._get_active_publication_cached(now.year, now.month, period, bucket)
 
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT * FROM publications
-                WHERE year = ? AND month = ? AND period = ? AND status = 'open'
-            ''', (year, month, period))
+        # Each caller gets its own copy of the shared cached object
+        return replace(publication) if publication else None
 
-            row = cursor.fetchone()
+    def _query_active_publication(self, year: int, month: int, period: str,
+                                  bucket: int) -> Optional[Publication]:
+        """Look up the open publication for a half-month window; bucket only keys the cache."""
+        with self.get_connection() as conn:
+            row = conn.execute(_SQL_GET_ACTIVE_PUBLICATION, (year, month, period)).fetchone()
 
             if row:
-                return Publication(
-                    id=row['id'],
-                    year=row['year'],
-                    month=row['month'],
-                    period=row['period'],
-                    status=row['status'],
-                    created_at=datetime.fromisoformat(row['created_at']),
-                    published_at=datetime.fromisoformat(row['published_at']) if row['published_at'] else None
-                )
+                return Publication.from_row(row)
             return None
 
+    def get_upcoming_open_publications(self, year: int, month: int,
+                                       limit: int) -> List[Publication]:
+        """
+        Get open publications from the given month onwards, soonest first.
+
+        Args:
+            year: Year of the earliest month to include
+            month: Earliest month to include (1-12)
+            limit: Maximum number of publications to return
+
+        Returns:
+            List of Publication objects
+        """
+        with self.get_connection() as conn:
+            cursor = conn.execute(_SQL_GET_UPCOMING_OPEN_PUBLICATIONS, (year, year, month, limit))
+
+            return [Publication.from_row(row) for row in cursor]
+
+    def get_publications_by_status(self, status: str, year: Optional[int] = None,
+                                   limit: Optional[int] = None) -> List[Publication]:
+        """
+        Get publications in a given status, newest first.
+
+        Args:
+            status: Publication status to filter by
+            year: Optional year to filter by
+            limit: Optional maximum number of publications to return
+
+        Returns:
+            List of Publication objects
+        """
+        with self.get_connection() as conn:
+            cursor = conn.execute(_SQL_GET_PUBLICATIONS_BY_STATUS,
+                                  (status, year, year, -1 if limit is None else limit))
+
+            return [Publication.from_row(row) for row in cursor]
+
     def update_publication_status(self, pub_id: int, status: str) -> bool:
         """Update publication status."""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-
             if status == 'published':
-                cursor.execute('''
-                    UPDATE publications
-                    SET status = ?, published_at = ?
-                    WHERE id = ?
-                ''', (status, datetime.now(), pub_id))
+                cursor = conn.execute(_SQL_PUBLISH_PUBLICATION, (status, self._now(), pub_id))
             else:
-                cursor.execute('''
-                    UPDATE publications
-                    SET status = ?
-                    WHERE id = ?
-                ''', (status, pub_id))
+                cursor = conn.execute(_SQL_UPDATE_PUBLICATION_STATUS, (status, pub_id))
 
+            self._get_active_publication_cached.cache_clear()
             return cursor.rowcount > 0
 
     # Submission CRUD operations
     def create_submission(self, publication_id: int, user_email: str,
-                         project_name: str, fields: Dict[str, str]) -> Submission:
-        """Create a new submission with fields."""
+                         project_name: str, fields: Dict[str, str],
+                         status: str = 'draft') -> Submission:
+        """Create a new submission with fields, as a draft or already submitted."""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            now = datetime.now()
+            now = self._now()
+            submitted_at = now if status == 'submitted' else None
 
             # Create submission
-            cursor.execute('''
-                INSERT INTO submissions
-                (publication_id, user_email, project_name, status, created_at, updated_at)
-                VALUES (?, ?, ?, 'draft', ?, ?)
-            ''', (publication_id, user_email, project_name, now, now))
+            cursor = conn.execute(_SQL_INSERT_SUBMISSION, (publication_id, user_email, project_name, status,
+                                                           _encode_fields(fields), now, now, submitted_at))
 
             submission_id = cursor.lastrowid
 
-            # Create submission fields
-            for field_name, field_value in fields.items():
-                # Convert lists to comma-separated strings for SQLite storage
-                if isinstance(field_value, list):
-                    field_value = ', '.join(str(item) for item in field_value)
-
-                cursor.execute('''
-                    INSERT INTO submission_fields
-                    (submission_id, field_name, field_value, created_at)
-                    VALUES (?, ?, ?, ?)
-                ''', (submission_id, field_name, str(field_value), now))
+            # Shadow-write the legacy per-field rows
+            conn.executemany(_SQL_INSERT_FIELD, [
+                (submission_id, field_name, _coerce_field_value(field_value), now)
+                for field_name, field_value in fields.items()
+            ])
 
             return Submission(
                 id=submission_id,
                 publication_id=publication_id,
                 user_email=user_email,
                 project_name=project_name,
-                status='draft',
+                status=status,
                 created_at=now,
-                updated_at=now
+                updated_at=now,
+                submitted_at=submitted_at
             )
 
     def get_submission(self, submission_id: int) -> Optional[Submission]:
         """Get a submission by ID."""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('SELECT * FROM submissions WHERE id = ?', (submission_id,))
-            row = cursor.fetchone()
+            row = conn.execute(_SQL_GET_SUBMISSION, (submission_id,)).fetchone()
 
             if row:
-                return Submission(
-                    id=row['id'],
-                    publication_id=row['publication_id'],
-                    user_email=row['user_email'],
-                    project_name=row['project_name'],
-                    status=row['status'],
-                    created_at=datetime.fromisoformat(row['created_at']),
-                    updated_at=datetime.fromisoformat(row['updated_at']),
-                    submitted_at=datetime.fromisoformat(row['submitted_at']) if row['submitted_at'] else None,
-                    reviewed_by=row['reviewed_by'],
-                    reviewed_at=datetime.fromisoformat(row['reviewed_at']) if row['reviewed_at'] else None
-                )
+                return Submission.from_row(row)
             return None
 
-    def get_submission_fields(self, submission_id: int) -> Dict[str, str]:
+    def get_submission_fields(self, submission_id: int) -> Dict[str, Any]:
         """Get all fields for a submission."""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT field_name, field_value
-                FROM submission_fields
-                WHERE submission_id = ?
-            ''', (submission_id,))
+            row = conn.execute(_SQL_GET_SUBMISSION_FIELDS, (submission_id,)).fetchone()
+
+            return _row_fields(row) if row else {}
+
+    def get_submission_fields_bulk(self, submission_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Get the fields of several submissions in a single query.
+
+        Args:
+            submission_ids: IDs of the submissions to fetch
+
+        Returns:
+            Mapping of submission ID to its fields; unknown IDs are omitted
+        """
+        if not submission_ids:
+            return {}
+
+        sql = _SQL_GET_SUBMISSION_FIELDS_BULK.format(
+            placeholders=', '.join('?' * len(submission_ids))
+        )
+        with self.get_connection() as conn:
+            cursor = conn.execute(sql, tuple(submission_ids))
+
+            return {row['id']: _row_fields(row) for row in cursor}
+
+    def get_submission_with_fields(self, submission_id: int) -> Tuple[Optional[Submission], Dict[str, Any]]:
+        """Get a submission and its fields in a single query."""
+        with self.get_connection() as conn:
+            row = conn.execute(_SQL_GET_SUBMISSION_WITH_FIELDS, (submission_id,)).fetchone()
 
-            rows = cursor.fetchall()
-            return {row['field_name']: row['field_value'] for row in rows}
+            if row:
+                return Submission.from_row(row), _row_fields(row)
+            return None, {}
 
     def get_submissions_by_publication(self, publication_id: int,
                                       status: Optional[str] = None) -> List[Submission]:
         """Get all submissions for a publication."""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-
             if status:
-                cursor.execute('''
-                    SELECT * FROM submissions
-                    WHERE publication_id = ? AND status = ?
-                    ORDER BY created_at DESC
-                ''', (publication_id, status))
+                cursor = conn.execute(_SQL_GET_SUBMISSIONS_BY_PUBLICATION_STATUS, (publication_id, status))
             else:
-                cursor.execute('''
-                    SELECT * FROM submissions
-                    WHERE publication_id = ?
-                    ORDER BY created_at DESC
-                ''', (publication_id,))
-
-            rows = cursor.fetchall()
-            submissions = []
-
-            for row in rows:
-                submissions.append(Submission(
-                    id=row['id'],
-                    publication_id=row['publication_id'],
-                    user_email=row['user_email'],
-                    project_name=row['project_name'],
-                    status=row['status'],
-                    created_at=datetime.fromisoformat(row['created_at']),
-                    updated_at=datetime.fromisoformat(row['updated_at']),
-                    submitted_at=datetime.fromisoformat(row['submitted_at']) if row['submitted_at'] else None,
-                    reviewed_by=row['reviewed_by'],
-                    reviewed_at=datetime.fromisoformat(row['reviewed_at']) if row['reviewed_at'] else None
-                ))
-
-            return submissions
+                cursor = conn.execute(_SQL_GET_SUBMISSIONS_BY_PUBLICATION, (publication_id,))
+
+            return [Submission.from_row(row) for row in cursor]
 
     def get_submissions_by_user(self, user_email: str) -> List[Submission]:
         """Get all submissions by a user."""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT * FROM submissions
-                WHERE user_email = ?
-                ORDER BY created_at DESC
-            ''', (user_email,))
-
-            rows = cursor.fetchall()
-            submissions = []
-
-            for row in rows:
-                submissions.append(Submission(
-                    id=row['id'],
-                    publication_id=row['publication_id'],
-                    user_email=row['user_email'],
-                    project_name=row['project_name'],
-                    status=row['status'],
-                    created_at=datetime.fromisoformat(row['created_at']),
-                    updated_at=datetime.fromisoformat(row['updated_at']),
-                    submitted_at=datetime.fromisoformat(row['submitted_at']) if row['submitted_at'] else None,
-                    reviewed_by=row['reviewed_by'],
-                    reviewed_at=datetime.fromisoformat(row['reviewed_at']) if row['reviewed_at'] else None
-                ))
-
-            return submissions
+            cursor = conn.execute(_SQL_GET_SUBMISSIONS_BY_USER, (user_email,))
+
+            return [Submission.from_row(row) for row in cursor]
+
+    def get_user_submissions_with_details(
+            self, user_email: str) -> List[Tuple[Submission, Dict[str, Any], Publication]]:
+        """
+        Get a user's submissions with their fields and publications in one query.
+
+        Args:
+            user_email: User's email
+
+        Returns:
+            List of (submission, fields, publication) tuples, newest first
+        """
+        with self.get_connection() as conn:
+            cursor = conn.execute(_SQL_GET_USER_SUBMISSIONS_WITH_DETAILS, (user_email,))
+
+            return [
+                (
+                    Submission.from_row(row),
+                    _row_fields(row),
+                    Publication(
+                        id=row['publication_id'],
+                        year=row['pub_year'],
+                        month=row['pub_month'],
+                        period=row['pub_period'],
+                        status=row['pub_status'],
+                        created_at=row['pub_created_at'],
+                        published_at=row['pub_published_at']
+                    )
+                )
+                for row in cursor
+            ]
+
+    def count_submissions_by_status(self, publication_id: int) -> Dict[str, int]:
+        """
+        Count a publication's submissions per status.
+
+        Args:
+            publication_id: Publication ID
+
+        Returns:
+            Mapping of status to submission count; absent statuses are omitted
+        """
+        with self.get_connection() as conn:
+            cursor = conn.execute(_SQL_COUNT_SUBMISSIONS_BY_STATUS, (publication_id,))
+
+            return {row['status']: row['n'] for row in cursor}
+
+    def count_submissions_by_status_for_year(self, year: int) -> Dict[int, Dict[str, int]]:
+        """
+        Count submissions per status for every publication in a year.
+
+        Args:
+            year: Publication year
+
+        Returns:
+            Mapping of publication ID to a status -> count mapping; publications
+            without submissions are omitted
+        """
+        counts: Dict[int, Dict[str, int]] = {}
+        with self.get_connection() as conn:
+            cursor = conn.execute(_SQL_COUNT_SUBMISSIONS_BY_STATUS_FOR_YEAR, (year,))
+
+            for row in cursor:
+                counts.setdefault(row['publication_id'], {})[row['status']] = row['n']
+
+        return counts
+
+    def count_submissions_per_publication(self, status: str) -> Dict[int, int]:
+        """
+        Count submissions in a given status for every publication.
+
+        Args:
+            status: Submission status to count
+
+        Returns:
+            Mapping of publication ID to count; publications with none are omitted
+        """
+        with self.get_connection() as conn:
+            cursor = conn.execute(_SQL_COUNT_SUBMISSIONS_PER_PUBLICATION, (status,))
+
+            return {row['publication_id']: row['n'] for row in cursor}
+
+    def submission_exists(self, publication_id: int, statuses: Tuple[str, ...]) -> bool:
+        """
+        Check whether a publication has any submission in the given statuses.
+
+        Args:
+            publication_id: Publication ID
+            statuses: Statuses to look for
+
+        Returns:
+            True if at least one matching submission exists
+        """
+        sql = _SQL_SUBMISSION_EXISTS.format(placeholders=', '.join('?' * len(statuses)))
+        with self.get_connection() as conn:
+            return conn.execute(sql, (publication_id, *statuses)).fetchone() is not None
 
     def update_submission_status(self, submission_id: int, status: str,
                                 reviewed_by: Optional[str] = None) -> bool:
         """Update submission status."""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            now = datetime.now()
+            now = self._now()
 
             if status == 'submitted':
-                cursor.execute('''
-                    UPDATE submissions
-                    SET status = ?, submitted_at = ?, updated_at = ?
-                    WHERE id = ?
-                ''', (status, now, now, submission_id))
+                cursor = conn.execute(_SQL_MARK_SUBMISSION_SUBMITTED, (status, now, now, submission_id))
             elif status in ['approved', 'rejected']:
-                cursor.execute('''
-                    UPDATE submissions
-                    SET status = ?, reviewed_by = ?, reviewed_at = ?, updated_at = ?
-                    WHERE id = ?
-                ''', (status, reviewed_by, now, now, submission_id))
+                cursor = conn.execute(_SQL_MARK_SUBMISSION_REVIEWED, (status, reviewed_by, now, now, submission_id))
             else:
-                cursor.execute('''
-                    UPDATE submissions
-                    SET status = ?, updated_at = ?
-                    WHERE id = ?
-                ''', (status, now, submission_id))
+                cursor = conn.execute(_SQL_UPDATE_SUBMISSION_STATUS, (status, now, submission_id))
 
             return cursor.rowcount > 0
 
     def update_submission_fields(self, submission_id: int, fields: Dict[str, str]) -> bool:
         """Update submission fields."""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            now = datetime.now()
-
-            # Delete existing fields
-            cursor.execute('DELETE FROM submission_fields WHERE submission_id = ?',
-                          (submission_id,))
-
-            # Insert updated fields
-            for field_name, field_value in fields.items():
-                # Convert lists to comma-separated strings for SQLite storage
-                if isinstance(field_value, list):
-                    field_value = ', '.join(str(item) for item in field_value)
-
-                cursor.execute('''
-                    INSERT INTO submission_fields
-                    (submission_id, field_name, field_value, created_at)
-                    VALUES (?, ?, ?, ?)
-                ''', (submission_id, field_name, str(field_value), now))
-
-            # Update submission updated_at
-            cursor.execute('''
-                UPDATE submissions
-                SET updated_at = ?
-                WHERE id = ?
-            ''', (now, submission_id))
+            now = self._now()
+
+            conn.execute(_SQL_UPDATE_SUBMISSION_FIELDS_JSON, (_encode_fields(fields), now, submission_id))
+
+            # Shadow-write the legacy per-field rows
+            conn.execute(_SQL_DELETE_SUBMISSION_FIELDS, (submission_id,))
+            conn.executemany(_SQL_INSERT_FIELD, [
+                (submission_id, field_name, _coerce_field_value(field_value), now)
+                for field_name, field_value in fields.items()
+            ])
 
             return True
 
@@ -433,52 +854,24 @@ class DatabaseManager:
                           suggested_content: Dict[str, Any], accepted: bool = False) -> int:
         """Save AI suggestions for a submission."""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            now = datetime.now()
+            now = self._now()
 
-            cursor.execute('''
-                INSERT INTO ai_suggestions
-                (submission_id, original_content, suggested_content, accepted, created_at)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (submission_id, json.dumps(original_content),
-                  json.dumps(suggested_content), int(accepted), now))
+            cursor = conn.execute(_SQL_INSERT_AI_SUGGESTION, (submission_id, json.dumps(original_content),
+                                                              json.dumps(suggested_content), int(accepted), now))
 
             return cursor.lastrowid
 
     def get_ai_suggestions(self, submission_id: int) -> List[AISuggestion]:
         """Get all AI suggestions for a submission."""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT * FROM ai_suggestions
-                WHERE submission_id = ?
-                ORDER BY created_at DESC
-            ''', (submission_id,))
-
-            rows = cursor.fetchall()
-            suggestions = []
-
-            for row in rows:
-                suggestions.append(AISuggestion(
-                    id=row['id'],
-                    submission_id=row['submission_id'],
-                    original_content=json.loads(row['original_content']),
-                    suggested_content=json.loads(row['suggested_content']),
-                    accepted=bool(row['accepted']),
-                    created_at=datetime.fromisoformat(row['created_at'])
-                ))
-
-            return suggestions
+            cursor = conn.execute(_SQL_GET_AI_SUGGESTIONS, (submission_id,))
+
+            return [AISuggestion.from_row(row) for row in cursor]
 
     def update_ai_suggestion_accepted(self, suggestion_id: int, accepted: bool) -> bool:
         """Update whether an AI suggestion was accepted."""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                UPDATE ai_suggestions
-                SET accepted = ?
-                WHERE id = ?
-            ''', (int(accepted), suggestion_id))
+            cursor = conn.execute(_SQL_UPDATE_AI_SUGGESTION_ACCEPTED, (int(accepted), suggestion_id))
 
             return cursor.rowcount > 0
 
@@ -486,13 +879,9 @@ class DatabaseManager:
     def create_user(self, email: str, name: str, role: str) -> User:
         """Create a new user."""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            now = datetime.now()
+            now = self._now()
 
-            cursor.execute('''
-                INSERT INTO users (email, name, role, created_at)
-                VALUES (?, ?, ?, ?)
-            ''', (email, name, role, now))
+            conn.execute(_SQL_INSERT_USER, (email, name, role, now))
 
             return User(
                 email=email,
@@ -501,31 +890,30 @@ class DatabaseManager:
                 created_at=now
             )
 
+    def create_user_if_missing(self, email: str, name: str, role: str) -> bool:
+        """
+        Create a user unless one with this email already exists.
+
+        Returns:
+            True if the user was created, False if it already existed
+        """
+        with self.get_connection() as conn:
+            cursor = conn.execute(_SQL_INSERT_USER_IF_MISSING, (email, name, role, self._now()))
+
+            return cursor.rowcount > 0
+
     def get_user(self, email: str) -> Optional[User]:
         """Get a user by email."""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('SELECT * FROM users WHERE email = ?', (email,))
-            row = cursor.fetchone()
+            row = conn.execute(_SQL_GET_USER, (email,)).fetchone()
 
             if row:
-                return User(
-                    email=row['email'],
-                    name=row['name'],
-                    role=row['role'],
-                    created_at=datetime.fromisoformat(row['created_at']),
-                    last_login=datetime.fromisoformat(row['last_login']) if row['last_login'] else None
-                )
+                return User.from_row(row)
             return None
 
     def update_user_last_login(self, email: str) -> bool:
         """Update user's last login timestamp."""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                UPDATE users
-                SET last_login = ?
-                WHERE email = ?
-            ''', (datetime.now(), email))
+            cursor = conn.execute(_SQL_UPDATE_USER_LAST_LOGIN, (self._now(), email))
 
             return cursor.rowcount > 0
@@ -12,13 +12,12 @@ def generate_annual_publications(db_manager: DatabaseManager, year: int):
     """Generate all 24 publication cycles for a given year."""
     periods = ['first_half', 'second_half']
 
-    for month in range(1, 13):  # 1-12
-        for period in periods:
-            try:
-                pub = db_manager.create_publication(year, month, period)
-                print(f"Created publication: {pub.get_display_name()}")
-            except Exception as e:
-                print(f"Publication already exists or error: {e}")
+    created = db_manager.create_publications_bulk([
+        (year, month, period)
+        for month in range(1, 13)  # 1-12
+        for period in periods
+    ])
+    print(f"Created {created} publications for {year}")
 
 
 def seed_sample_users(db_manager: DatabaseManager):
@@ -29,12 +28,11 @@ def seed_sample_users(db_manager: DatabaseManager):
         ('approver1@organization.com', 'Admin User', 'approver'),
     ]
 
-    for email, name, role in sample_users:
-        try:
-            user = db_manager.create_user(email, name, role)
-            print(f"Created user: {user.name} ({user.role})")
-        except Exception as e:
-            print(f"User already exists or error: {e}")
+    created = sum(
+        db_manager.create_user_if_missing(email, name, role)
+        for email, name, role in sample_users
+    )
+    print(f"Created {created} users ({len(sample_users) - created} already existed)")
 
 
 def initialize_database(db_path: str = './database/spotlight.db'):
@@ -47,22 +45,26 @@ def initialize_database(db_path: str = './database/spotlight.db'):
     # Initialize database manager
     db_manager = DatabaseManager(db_path)
 
-    print("Creating database tables...")
-    db_manager.create_tables()
-    print("Tables created successfully!")
-
-    # Generate publications for current year
-    current_year = datetime.now().year
-    print(f"\nGenerating publications for {current_year}...")
-    generate_annual_publications(db_manager, current_year)
-
-    # Optionally generate for next year as well
-    print(f"\nGenerating publications for {current_year + 1}...")
-    generate_annual_publications(db_manager, current_year + 1)
-
-    # Seed sample users
-    print("\nCreating sample users...")
-    seed_sample_users(db_manager)
+    try:
+        print("Creating database tables...")
+        db_manager.create_tables()
+        print("Tables created successfully!")
+
+        # Generate publications for current year
+        current_year = datetime.now().year
+        print(f"\nGenerating publications for {current_year}...")
+        generate_annual_publications(db_manager, current_year)
+
+        # Optionally generate for next year as well
+        print(f"\nGenerating publications for {current_year + 1}...")
+        generate_annual_publications(db_manager, current_year + 1)
+
+        # Seed sample users
+        print("\nCreating sample users...")
+        seed_sample_users(db_manager)
+    finally:
+        # Callers open their own managers; don't leave this one's connection open
+        db_manager.close_all()
 
     print("\nDatabase initialization complete!")
 
@@ -4,10 +4,31 @@ Data models for the Organizational Spotlight application.
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, Mapping
 import json
 
 
+_MONTH_NAMES = (
+    'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December'
+)
+
+_PERIOD_DISPLAY = {'first_half': 'First Half', 'second_half': 'Second Half'}
+
+
+def _iso(dt: Optional[datetime]) -> Optional[str]:
+    """Format a timestamp as ISO 8601, passing None through."""
+    return dt.isoformat() if dt is not None else None
+
+
+@lru_cache(maxsize=64)
+def _display_name(year: int, month: int, period: str) -> str:
+    """Format a publication display name; cached per publication cycle."""
+    period_display = _PERIOD_DISPLAY.get(period, 'Second Half')
+    return f"{period_display} {_MONTH_NAMES[month - 1]} {year}"
+
+
 @dataclass
 class Publication:
     """Represents a bi-monthly publication cycle."""
@@ -19,27 +40,45 @@ class Publication:
     created_at: datetime
     published_at: Optional[datetime] = None
 
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> 'Publication':
+        """Build a Publication from a ``publications`` table row."""
+        return cls(
+            id=row['id'],
+            year=row['year'],
+            month=row['month'],
+            period=row['period'],
+            status=row['status'],
+            created_at=row['created_at'],
+            published_at=row['published_at']
+        )
+
     def get_display_name(self) -> str:
         """Return a human-readable name for the publication."""
-        month_names = [
-            'January', 'February', 'March', 'April', 'May', 'June',
-            'July', 'August', 'September', 'October', 'November', 'December'
-        ]
-        period_display = 'First Half' if self.period == 'first_half' else 'Second Half'
-        return f"{period_display} {month_names[self.month - 1]} {self.year}"
+        return _display_name(self.year, self.month, self.period)
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return {
+    def to_dict(self, include_display: bool = True) -> Dict[str, Any]:
+        """
+        Convert to dictionary.
+
+        Args:
+            include_display: Whether to add the formatted ``display_name``
+
+        Returns:
+            Dictionary of publication attributes
+        """
+        data = {
             'id': self.id,
             'year': self.year,
             'month': self.month,
             'period': self.period,
             'status': self.status,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'published_at': self.published_at.isoformat() if self.published_at else None,
-            'display_name': self.get_display_name()
+            'created_at': _iso(self.created_at),
+            'published_at': _iso(self.published_at)
         }
+        if include_display:
+            data['display_name'] = self.get_display_name()
+        return data
 
 
 @dataclass
@@ -56,6 +95,22 @@ class Submission:
     reviewed_by: Optional[str] = None
     reviewed_at: Optional[datetime] = None
 
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> 'Submission':
+        """Build a Submission from a ``submissions`` table row."""
+        return cls(
+            id=row['id'],
+            publication_id=row['publication_id'],
+            user_email=row['user_email'],
+            project_name=row['project_name'],
+            status=row['status'],
+            created_at=row['created_at'],
+            updated_at=row['updated_at'],
+            submitted_at=row['submitted_at'],
+            reviewed_by=row['reviewed_by'],
+            reviewed_at=row['reviewed_at']
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -64,11 +119,11 @@ class Submission:
             'user_email': self.user_email,
             'project_name': self.project_name,
             'status': self.status,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-            'submitted_at': self.submitted_at.isoformat() if self.submitted_at else None,
+            'created_at': _iso(self.created_at),
+            'updated_at': _iso(self.updated_at),
+            'submitted_at': _iso(self.submitted_at),
             'reviewed_by': self.reviewed_by,
-            'reviewed_at': self.reviewed_at.isoformat() if self.reviewed_at else None
+            'reviewed_at': _iso(self.reviewed_at)
         }
 
 
@@ -88,7 +143,7 @@ class SubmissionField:
             'submission_id': self.submission_id,
             'field_name': self.field_name,
             'field_value': self.field_value,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'created_at': _iso(self.created_at)
         }
 
 
@@ -102,6 +157,18 @@ class AISuggestion:
     accepted: bool
     created_at: datetime
 
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> 'AISuggestion':
+        """Build an AISuggestion from an ``ai_suggestions`` table row."""
+        return cls(
+            id=row['id'],
+            submission_id=row['submission_id'],
+            original_content=json.loads(row['original_content']),
+            suggested_content=json.loads(row['suggested_content']),
+            accepted=bool(row['accepted']),
+            created_at=row['created_at']
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -110,7 +177,7 @@ class AISuggestion:
             'original_content': self.original_content,
             'suggested_content': self.suggested_content,
             'accepted': self.accepted,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'created_at': _iso(self.created_at)
         }
 
 
@@ -123,12 +190,23 @@ class User:
     created_at: datetime
     last_login: Optional[datetime] = None
 
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> 'User':
+        """Build a User from a ``users`` table row."""
+        return cls(
+            email=row['email'],
+            name=row['name'],
+            role=row['role'],
+            created_at=row['created_at'],
+            last_login=row['last_login']
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
             'email': self.email,
             'name': self.name,
             'role': self.role,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'last_login': self.last_login.isoformat() if self.last_login else None
+            'created_at': _iso(self.created_at),
+            'last_login': _iso(self.last_login)
         }
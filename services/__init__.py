@@ -1,13 +1,24 @@
 """Services package for Organizational Spotlight application."""
 
-from services.ai_service import AIService, get_ai_service
-from services.email_service import EmailService, get_email_service
-from services.publication_service import PublicationService
-
-__all__ = [
-    'AIService',
-    'get_ai_service',
-    'EmailService',
-    'get_email_service',
-    'PublicationService'
-]
+import importlib
+
+# Exports resolved on first access, so importing one service module (e.g.
+# services.publication_service) doesn't pull in the AI and email stacks
+_EXPORTS = {
+    'AIService': 'services.ai_service',
+    'AISuggestionError': 'services.ai_service',
+    'get_ai_service': 'services.ai_service',
+    'EmailService': 'services.email_service',
+    'get_email_service': 'services.email_service',
+    'PublicationService': 'services.publication_service',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import the submodule behind a package-level export on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
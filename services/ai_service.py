@@ -3,13 +3,74 @@ AI service for generating content suggestions using AWS Bedrock.
 """
 
 import json
-import boto3
-from typing import Dict, Any, Optional
-from botocore.exceptions import ClientError
+import re
+import string
+import threading
+import time
+from typing import Callable, Dict, Any, Optional, Tuple
 import streamlit as st
 
 from config import settings
 
+# Prefer orjson for encoding requests and parsing model output; fall back to
+# the stdlib. orjson's decode error subclasses json.JSONDecodeError.
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+
+# Bedrock clients shared across AIService instances, keyed on what they were
+# built from; boto3 clients are thread-safe once created
+_CLIENT_CACHE: Dict[Tuple[str, Optional[str]], Any] = {}
+_CLIENT_LOCK = threading.Lock()
+
+# Bedrock error codes worth retrying with backoff; anything else fails fast
+_RETRYABLE_ERROR_CODES = frozenset({'ThrottlingException', 'ServiceUnavailableException'})
+
+# Prompt placeholders and the value used when a submission lacks the field
+_PROMPT_DEFAULTS = (
+    ('project_name', 'N/A'),
+    ('title', ''),
+    ('description', ''),
+    ('key_achievements', ''),
+    ('impact', ''),
+    ('category', 'N/A'),
+)
+
+# Outermost {...} block in a model reply that wraps JSON in prose
+_JSON_BLOCK_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+
+def _check_prompt_template(template: str) -> str:
+    """
+    Verify that a prompt template only uses known placeholders.
+
+    Args:
+        template: str.format-style prompt template
+
+    Returns:
+        The template, unchanged
+
+    Raises:
+        ValueError: If the template references an unknown placeholder
+    """
+    known = {name for name, _ in _PROMPT_DEFAULTS}
+    unknown = {
+        field for _, field, _, _ in string.Formatter().parse(template)
+        if field is not None and field not in known
+    }
+    if unknown:
+        raise ValueError(f"Unknown AI prompt placeholders: {', '.join(sorted(unknown))}")
+    return template
+
+
+class AISuggestionError(Exception):
+    """Raised when the model reply cannot be turned into suggestions."""
+
 
 class AIService:
     """Service for AI-powered content enhancement using AWS Bedrock."""
@@ -19,20 +80,37 @@ class AIService:
         self.region = settings.AWS_REGION
         self.model_id = settings.BEDROCK_MODEL_ID
         self.client = None
+        self.prompt_template = _check_prompt_template(settings.AI_PROMPT_TEMPLATE)
 
     def _get_bedrock_client(self):
         """Get or create Bedrock runtime client."""
         if self.client is None:
-            try:
-                self.client = boto3.client(
-                    service_name='bedrock-runtime',
-                    region_name=self.region,
-                    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
-                )
-            except Exception as e:
-                st.error(f"Failed to initialize AWS Bedrock client: {str(e)}")
-                raise
+            key = (self.region, settings.AWS_ACCESS_KEY_ID)
+            with _CLIENT_LOCK:
+                client = _CLIENT_CACHE.get(key)
+                if client is None:
+                    # boto3 is heavy to import; defer it until AI features are used
+                    import boto3
+                    from botocore.config import Config
+
+                    try:
+                        client = boto3.client(
+                            service_name='bedrock-runtime',
+                            region_name=self.region,
+                            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                            # Retries are handled by generate_suggestions_with_retry
+                            config=Config(
+                                retries={'mode': 'standard', 'total_max_attempts': 1},
+                                max_pool_connections=10,
+                                tcp_keepalive=True
+                            )
+                        )
+                    except Exception as e:
+                        st.error(f"Failed to initialize AWS Bedrock client: {str(e)}")
+                        raise
+                    _CLIENT_CACHE[key] = client
+            self.client = client
 
         return self.client
 
@@ -46,15 +124,128 @@ class AIService:
         Returns:
             Formatted prompt string
         """
-        return settings.AI_PROMPT_TEMPLATE.format(
-            project_name=submission_data.get('project_name', 'N/A'),
-            title=submission_data.get('title', ''),
-            description=submission_data.get('description', ''),
-            key_achievements=submission_data.get('key_achievements', ''),
-            impact=submission_data.get('impact', ''),
-            category=submission_data.get('category', 'N/A')
+        return self.prompt_template.format_map({
+            name: submission_data.get(name, default) for name, default in _PROMPT_DEFAULTS
+        })
+
+    def _build_request_body(self, submission_data: Dict[str, str]) -> bytes:
+        """Encode the Bedrock request body for a submission."""
+        prompt = self.format_prompt(submission_data)
+
+        # Prepare the request body for Claude
+        request_body = {
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": 2000,
+            "temperature": 0.7,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ]
+        }
+        return _json_dumps(request_body)
+
+    @staticmethod
+    def _parse_suggestions(content: str) -> Dict[str, str]:
+        """
+        Parse the model's reply text into suggestions.
+
+        Args:
+            content: Text returned by the model
+
+        Returns:
+            Dictionary with suggested improvements
+
+        Raises:
+            AISuggestionError: If no JSON object can be extracted
+        """
+        # Try to parse as JSON
+        try:
+            return _json_loads(content)
+        except json.JSONDecodeError:
+            # If not JSON, try to extract JSON from the content
+            json_match = _JSON_BLOCK_RE.search(content)
+            if json_match:
+                try:
+                    return _json_loads(json_match.group())
+                except json.JSONDecodeError:
+                    pass
+            raise AISuggestionError("Failed to parse AI suggestions as JSON")
+
+    def _request_suggestions(self, submission_data: Dict[str, str]) -> Dict[str, str]:
+        """
+        Call Bedrock and parse the suggested content.
+
+        Args:
+            submission_data: Dictionary containing submission fields
+
+        Returns:
+            Dictionary with suggested improvements
+
+        Raises:
+            AISuggestionError: If the reply has no usable JSON content
+            botocore.exceptions.ClientError: If the Bedrock call fails
+        """
+        client = self._get_bedrock_client()
+
+        # Invoke the model
+        response = client.invoke_model(
+            modelId=self.model_id,
+            body=self._build_request_body(submission_data)
         )
 
+        # Parse the response
+        response_body = json.load(response['body'])
+
+        # Extract the content from Claude's response
+        if not response_body.get('content'):
+            raise AISuggestionError("No content in AI response")
+
+        return self._parse_suggestions(response_body['content'][0]['text'])
+
+    def _stream_suggestions(self, submission_data: Dict[str, str],
+                            on_text: Callable[[str], None]) -> Dict[str, str]:
+        """
+        Stream the model reply, reporting text as it arrives.
+
+        Args:
+            submission_data: Dictionary containing submission fields
+            on_text: Called with the accumulated reply after each text delta
+
+        Returns:
+            Dictionary with suggested improvements
+
+        Raises:
+            AISuggestionError: If the reply has no usable JSON content
+            botocore.exceptions.ClientError: If the Bedrock call fails
+        """
+        client = self._get_bedrock_client()
+
+        response = client.invoke_model_with_response_stream(
+            modelId=self.model_id,
+            body=self._build_request_body(submission_data)
+        )
+
+        # Running reply; appending each delta avoids re-joining the whole
+        # buffer for every on_text call
+        text = ''
+        received = False
+        for event in response['body']:
+            chunk = event.get('chunk')
+            if not chunk:
+                continue
+            payload = _json_loads(chunk['bytes'])
+            if payload.get('type') == 'content_block_delta':
+                received = True
+                text += payload['delta'].get('text', '')
+                on_text(text)
+
+        if not received:
+            raise AISuggestionError("No content in AI response")
+
+        return self._parse_suggestions(text)
+
     def generate_suggestions(self, submission_data: Dict[str, str]) -> Optional[Dict[str, str]]:
         """
         Generate AI-powered suggestions for submission content.
@@ -65,54 +256,40 @@ class AIService:
         Returns:
             Dictionary with suggested improvements or None if generation failed
         """
+        from botocore.exceptions import ClientError
+
         try:
-            client = self._get_bedrock_client()
-            prompt = self.format_prompt(submission_data)
-
-            # Prepare the request body for Claude
-            request_body = {
-                "anthropic_version": "bedrock-2023-05-31",
-                "max_tokens": 2000,
-                "temperature": 0.7,
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
-            }
-
-            # Invoke the model
-            response = client.invoke_model(
-                modelId=self.model_id,
-                body=json.dumps(request_body)
-            )
-
-            # Parse the response
-            response_body = json.loads(response['body'].read())
-
-            # Extract the content from Claude's response
-            if 'content' in response_body and len(response_body['content']) > 0:
-                content = response_body['content'][0]['text']
-
-                # Try to parse as JSON
-                try:
-                    suggestions = json.loads(content)
-                    return suggestions
-                except json.JSONDecodeError:
-                    # If not JSON, try to extract JSON from the content
-                    import re
-                    json_match = re.search(r'\{[^}]+\}', content, re.DOTALL)
-                    if json_match:
-                        suggestions = json.loads(json_match.group())
-                        return suggestions
-                    else:
-                        st.error("Failed to parse AI suggestions as JSON")
-                        return None
-            else:
-                st.error("No content in AI response")
-                return None
+            return self._request_suggestions(submission_data)
+        except AISuggestionError as e:
+            st.error(str(e))
+            return None
+        except ClientError as e:
+            st.error(f"AWS Bedrock API error: {str(e)}")
+            return None
+        except Exception as e:
+            st.error(f"Error generating AI suggestions: {str(e)}")
+            return None
+
+    def generate_suggestions_stream(self, submission_data: Dict[str, str],
+                                    on_text: Callable[[str], None]) -> Optional[Dict[str, str]]:
+        """
+        Generate AI suggestions, streaming the reply while it is produced.
+
+        Args:
+            submission_data: Dictionary containing submission fields
+            on_text: Called with the reply received so far, e.g. a placeholder's
+                ``markdown`` method
+
+        Returns:
+            Dictionary with suggested improvements or None if generation failed
+        """
+        from botocore.exceptions import ClientError
 
+        try:
+            return self._stream_suggestions(submission_data, on_text)
+        except AISuggestionError as e:
+            st.error(str(e))
+            return None
         except ClientError as e:
             st.error(f"AWS Bedrock API error: {str(e)}")
             return None
@@ -123,26 +300,39 @@ class AIService:
     def generate_suggestions_with_retry(self, submission_data: Dict[str, str],
                                        max_retries: int = 3) -> Optional[Dict[str, str]]:
         """
-        Generate AI suggestions with retry logic.
+        Generate AI suggestions, backing off and retrying when throttled.
+
+        Only throttling and service-unavailable errors are retried; other
+        failures are reported immediately.
 
         Args:
             submission_data: Dictionary containing submission fields
-            max_retries: Maximum number of retry attempts
+            max_retries: Maximum number of attempts
 
         Returns:
-            Dictionary with suggested improvements or None if all retries failed
+            Dictionary with suggested improvements or None if generation failed
         """
+        from botocore.exceptions import ClientError
+
         for attempt in range(max_retries):
             try:
-                result = self.generate_suggestions(submission_data)
-                if result:
-                    return result
-            except Exception as e:
+                return self._request_suggestions(submission_data)
+            except ClientError as e:
+                code = e.response.get('Error', {}).get('Code')
+                if code not in _RETRYABLE_ERROR_CODES:
+                    st.error(f"AWS Bedrock API error: {str(e)}")
+                    return None
                 if attempt == max_retries - 1:
                     st.error(f"Failed after {max_retries} attempts: {str(e)}")
                     return None
-                else:
-                    st.warning(f"Attempt {attempt + 1} failed, retrying...")
+                st.warning(f"Attempt {attempt + 1} failed, retrying...")
+                time.sleep(2 ** attempt * 0.5)
+            except AISuggestionError as e:
+                st.error(str(e))
+                return None
+            except Exception as e:
+                st.error(f"Error generating AI suggestions: {str(e)}")
+                return None
 
         return None
 
@@ -2,15 +2,24 @@
 Email service for sending publication emails via SMTP.
 """
 
+import re
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import List, Dict, Any
-from jinja2 import Template
+from contextlib import contextmanager
+from email.message import EmailMessage
+from typing import List, Dict, Any, Tuple
 import streamlit as st
 
 from config import settings
 from database.models import Submission, Publication
+from utils.helpers import load_template
+
+
+# Tags a rendered email must contain, matched in one case-insensitive pass
+_REQUIRED_TAGS = frozenset({'<html', '<body', '</body>', '</html>'})
+_REQUIRED_TAGS_RE = re.compile(r'<html|<body|</body>|</html>', re.IGNORECASE)
+
+# Recipients per publication message; longer lists are split across messages
+_RECIPIENTS_PER_MESSAGE = 50
 
 
 class EmailService:
@@ -38,10 +47,7 @@ class EmailService:
             Rendered HTML string
         """
         try:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template_content = f.read()
-
-            template = Template(template_content)
+            template = load_template(template_path)
 
             html = template.render(
                 publication=publication,
@@ -55,8 +61,39 @@ class EmailService:
             st.error(f"Error rendering email template: {str(e)}")
             raise
 
+    @contextmanager
+    def _smtp_session(self):
+        """
+        Open an authenticated SMTP connection.
+
+        Yields:
+            Logged-in smtplib.SMTP instance, closed when the block exits
+        """
+        with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
+            server.starttls()
+            server.login(self.smtp_email, self.smtp_password)
+            yield server
+
+    def _build_message(self, recipients: List[str], subject: str,
+                       html_content: str, text_content: str = None) -> EmailMessage:
+        """Assemble a multipart/alternative message with plain text and HTML parts."""
+        message = EmailMessage()
+        message['From'] = self.smtp_email
+        message['To'] = ', '.join(recipients)
+        message['Subject'] = subject
+
+        # Plain text part (fallback); generate a simple note if none given
+        message.set_content(text_content or 'Please view this email in HTML format.')
+
+        # HTML part; quoted-printable keeps mostly-ASCII markup close to its
+        # original size instead of growing by a third under base64
+        message.add_alternative(html_content, subtype='html', cte='quoted-printable')
+
+        return message
+
     def send_email(self, recipients: List[str], subject: str,
-                  html_content: str, text_content: str = None) -> bool:
+                  html_content: str, text_content: str = None,
+                  server: smtplib.SMTP = None) -> bool:
         """
         Send an email via SMTP.
 
@@ -65,35 +102,20 @@ class EmailService:
             subject: Email subject
             html_content: HTML content of the email
             text_content: Plain text content (optional fallback)
+            server: Already authenticated connection to reuse (optional)
 
         Returns:
             True if email sent successfully, False otherwise
         """
         try:
-            # Create message
-            message = MIMEMultipart('alternative')
-            message['From'] = self.smtp_email
-            message['To'] = ', '.join(recipients)
-            message['Subject'] = subject
-
-            # Add plain text part (fallback)
-            if text_content:
-                text_part = MIMEText(text_content, 'plain')
-                message.attach(text_part)
-            else:
-                # Generate simple text version from HTML
-                text_part = MIMEText('Please view this email in HTML format.', 'plain')
-                message.attach(text_part)
-
-            # Add HTML part
-            html_part = MIMEText(html_content, 'html')
-            message.attach(html_part)
-
-            # Connect to SMTP server and send
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_email, self.smtp_password)
+            message = self._build_message(recipients, subject, html_content, text_content)
+
+            if server is not None:
                 server.send_message(message)
+            else:
+                # Connect to SMTP server and send
+                with self._smtp_session() as session:
+                    session.send_message(message)
 
             return True
 
@@ -101,6 +123,28 @@ class EmailService:
             st.error(f"Failed to send email: {str(e)}")
             return False
 
+    def send_bulk(self, items: List[Tuple[List[str], str, str]]) -> bool:
+        """
+        Send several emails over a single SMTP connection.
+
+        Args:
+            items: List of (recipients, subject, html_content) tuples
+
+        Returns:
+            True if every email was sent, False otherwise
+        """
+        try:
+            with self._smtp_session() as server:
+                results = [
+                    self.send_email(recipients, subject, html_content, server=server)
+                    for recipients, subject, html_content in items
+                ]
+        except Exception as e:
+            st.error(f"Failed to send email: {str(e)}")
+            return False
+
+        return all(results)
+
     def send_publication_email(self, publication: Publication,
                               submissions: List[Dict[str, Any]],
                               recipients: List[str] = None) -> bool:
@@ -128,8 +172,14 @@ class EmailService:
             st.error(f"Failed to render email: {str(e)}")
             return False
 
-        # Send email
-        return self.send_email(recipients, subject, html_content)
+        # Send email, splitting long recipient lists over one connection
+        if len(recipients) <= _RECIPIENTS_PER_MESSAGE:
+            return self.send_email(recipients, subject, html_content)
+
+        return self.send_bulk([
+            (recipients[i:i + _RECIPIENTS_PER_MESSAGE], subject, html_content)
+            for i in range(0, len(recipients), _RECIPIENTS_PER_MESSAGE)
+        ])
 
     def send_test_email(self, recipient: str) -> bool:
         """
@@ -166,13 +216,8 @@ class EmailService:
             True if valid, False otherwise
         """
         # Basic validation - check for required HTML tags
-        required_tags = ['<html', '<body', '</body>', '</html>']
-
-        for tag in required_tags:
-            if tag.lower() not in html_content.lower():
-                return False
-
-        return True
+        found = {tag.lower() for tag in _REQUIRED_TAGS_RE.findall(html_content)}
+        return found >= _REQUIRED_TAGS
 
 
 # Singleton instance
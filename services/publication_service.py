@@ -2,12 +2,36 @@
 Publication service for managing publication cycles.
 """
 
+from calendar import monthrange
 from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from database.db_manager import DatabaseManager
 from database.models import Publication
 
 
+@lru_cache(maxsize=256)
+def _period_range(year: int, month: int, period: str) -> Tuple[datetime, datetime]:
+    """Compute the first and last moment of a publication period."""
+    if period == 'first_half':
+        return datetime(year, month, 1), datetime(year, month, 15, 23, 59, 59)
+
+    # second_half runs to the last day of the month
+    last_day = monthrange(year, month)[1]
+    return datetime(year, month, 16), datetime(year, month, last_day, 23, 59, 59)
+
+
+def _stats_from_counts(counts: Dict[str, int]) -> dict:
+    """Shape per-status submission counts into a publication stats dict."""
+    return {
+        'total': sum(counts.values()),
+        'draft': counts.get('draft', 0),
+        'submitted': counts.get('submitted', 0),
+        'approved': counts.get('approved', 0),
+        'rejected': counts.get('rejected', 0)
+    }
+
+
 class PublicationService:
     """Service for managing publication cycles."""
 
@@ -24,25 +48,21 @@ class PublicationService:
         """
         Generate all 24 publication cycles for a given year (2 per month).
 
+        Cycles that already exist are left untouched, so this is safe to re-run.
+
         Args:
             year: Year to generate publications for
 
         Returns:
-            List of created Publication objects
+            List of the year's Publication objects
         """
-        publications = []
-        periods = ['first_half', 'second_half']
+        self.db.create_publications_bulk([
+            (year, month, period)
+            for month in range(1, 13)
+            for period in ('first_half', 'second_half')
+        ])
 
-        for month in range(1, 13):  # 1-12
-            for period in periods:
-                try:
-                    pub = self.db.create_publication(year, month, period)
-                    publications.append(pub)
-                except Exception as e:
-                    # Publication might already exist
-                    print(f"Could not create publication for {year}-{month}-{period}: {e}")
-
-        return publications
+        return self.db.get_all_publications(year)
 
     def get_active_publication(self) -> Optional[Publication]:
         """
@@ -111,21 +131,23 @@ class PublicationService:
         Returns:
             Dictionary with publication statistics
         """
-        submissions = self.db.get_submissions_by_publication(pub_id)
-
-        stats = {
-            'total': len(submissions),
-            'draft': 0,
-            'submitted': 0,
-            'approved': 0,
-            'rejected': 0
-        }
+        return _stats_from_counts(self.db.count_submissions_by_status(pub_id))
 
-        for sub in submissions:
-            if sub.status in stats:
-                stats[sub.status] += 1
+    def get_publication_stats_for_year(self, year: int) -> Dict[int, dict]:
+        """
+        Get statistics for every publication in a year with one query.
 
-        return stats
+        Args:
+            year: Publication year
+
+        Returns:
+            Mapping of publication ID to its statistics, as returned by
+            get_publication_stats; publications without submissions are omitted
+        """
+        return {
+            pub_id: _stats_from_counts(counts)
+            for pub_id, counts in self.db.count_submissions_by_status_for_year(year).items()
+        }
 
     def is_publication_ready_to_publish(self, pub_id: int) -> bool:
         """
@@ -139,17 +161,12 @@ class PublicationService:
         Returns:
             True if ready to publish, False otherwise
         """
-        stats = self.get_publication_stats(pub_id)
-
         # Must have at least one approved submission
-        if stats['approved'] == 0:
+        if not self.db.submission_exists(pub_id, ('approved',)):
             return False
 
         # Should not have pending submissions (draft or submitted)
-        if stats['draft'] > 0 or stats['submitted'] > 0:
-            return False
-
-        return True
+        return not self.db.submission_exists(pub_id, ('draft', 'submitted'))
 
     def get_upcoming_publications(self, limit: int = 5) -> List[Publication]:
         """
@@ -159,24 +176,11 @@ class PublicationService:
             limit: Maximum number of publications to return
 
         Returns:
-            List of upcoming Publication objects
+            List of upcoming Publication objects, soonest first
         """
         now = datetime.now()
-        all_pubs = self.db.get_all_publications()
 
-        # Filter publications that are still open and in the future or current
-        upcoming = []
-        for pub in all_pubs:
-            if pub.status == 'open':
-                # Simple date comparison
-                pub_date = datetime(pub.year, pub.month, 1)
-                if pub_date >= datetime(now.year, now.month, 1):
-                    upcoming.append(pub)
-
-                if len(upcoming) >= limit:
-                    break
-
-        return upcoming
+        return self.db.get_upcoming_open_publications(now.year, now.month, limit)
 
     def get_published_publications(self, year: Optional[int] = None,
                                    limit: Optional[int] = None) -> List[Publication]:
@@ -190,14 +194,7 @@ class PublicationService:
         Returns:
             List of published Publication objects
         """
-        all_pubs = self.db.get_all_publications(year)
-
-        published = [pub for pub in all_pubs if pub.status == 'published']
-
-        if limit:
-            published = published[:limit]
-
-        return published
+        return self.db.get_publications_by_status('published', year, limit or None)
 
     def ensure_current_year_publications(self):
         """
@@ -225,22 +222,7 @@ class PublicationService:
         Returns:
             Tuple of (start_date, end_date) as datetime objects
         """
-        if period == 'first_half':
-            start_date = datetime(year, month, 1)
-            end_date = datetime(year, month, 15, 23, 59, 59)
-        else:  # second_half
-            start_date = datetime(year, month, 16)
-
-            # Calculate last day of month
-            if month == 12:
-                next_month = datetime(year + 1, 1, 1)
-            else:
-                next_month = datetime(year, month + 1, 1)
-
-            from datetime import timedelta
-            end_date = next_month - timedelta(seconds=1)
-
-        return start_date, end_date
+        return _period_range(year, month, period)
 
     def is_publication_period_active(self, pub: Publication) -> bool:
         """
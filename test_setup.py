@@ -3,54 +3,49 @@ Test script to verify setup and configuration.
 Run this script to check if all components are properly configured.
 """
 
+import importlib.util
+import os
 import sys
 from pathlib import Path
 
 
+# (module, display name, pip package) for each required dependency
+REQUIRED_PACKAGES = [
+    ('streamlit', 'Streamlit', 'streamlit'),
+    ('boto3', 'Boto3', 'boto3'),
+    ('yaml', 'PyYAML', 'pyyaml'),
+    ('jinja2', 'Jinja2', 'jinja2'),
+    ('streamlit_authenticator', 'Streamlit-authenticator', 'streamlit-authenticator'),
+]
+
+
 def test_imports():
-    """Test if all required modules can be imported."""
+    """Test if all required modules are installed, without importing them."""
     print("Testing imports...")
 
-    try:
-        import streamlit
-        print("✅ Streamlit installed")
-    except ImportError:
-        print("❌ Streamlit not installed. Run: pip install streamlit")
-        return False
+    for module_name, label, package in REQUIRED_PACKAGES:
+        if importlib.util.find_spec(module_name) is None:
+            print(f"❌ {label} not installed. Run: pip install {package}")
+            return False
+        print(f"✅ {label} installed")
 
-    try:
-        import boto3
-        print("✅ Boto3 installed")
-    except ImportError:
-        print("❌ Boto3 not installed. Run: pip install boto3")
-        return False
-
-    try:
-        import yaml
-        print("✅ PyYAML installed")
-    except ImportError:
-        print("❌ PyYAML not installed. Run: pip install pyyaml")
-        return False
+    return True
 
-    try:
-        import jinja2
-        print("✅ Jinja2 installed")
-    except ImportError:
-        print("❌ Jinja2 not installed. Run: pip install jinja2")
-        return False
 
+def scan_dir(path):
+    """List a directory once, mapping entry names to DirEntry objects."""
     try:
-        import streamlit_authenticator
-        print("✅ Streamlit-authenticator installed")
-    except ImportError:
-        print("❌ Streamlit-authenticator not installed. Run: pip install streamlit-authenticator")
-        return False
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except FileNotFoundError:
+        return {}
 
-    return True
 
+def test_project_structure(fast=False):
+    """Test if all required directories and files exist.
 
-def test_project_structure():
-    """Test if all required directories and files exist."""
+    With ``fast`` set, stop at the first missing directory or file.
+    """
     print("\nTesting project structure...")
 
     required_dirs = [
@@ -68,25 +63,47 @@ def test_project_structure():
         'templates/email_template.html'
     ]
 
-    all_good = True
+    # One listing per directory; DirEntry caches the file type
+    listings = {}
 
-    for dir_name in required_dirs:
-        if Path(dir_name).is_dir():
-            print(f"✅ Directory exists: {dir_name}")
-        else:
-            print(f"❌ Directory missing: {dir_name}")
-            all_good = False
+    def entry_for(path):
+        parent, name = os.path.split(path)
+        if parent not in listings:
+            listings[parent] = scan_dir(parent or '.')
+        return listings[parent].get(name)
 
-    for file_name in required_files:
-        if Path(file_name).is_file():
-            print(f"✅ File exists: {file_name}")
+    checks = [(name, 'Directory', True) for name in required_dirs]
+    checks += [(name, 'File', False) for name in required_files]
+
+    lines = []
+    all_good = True
+    for path, kind, want_dir in checks:
+        entry = entry_for(path)
+        if entry is not None and (entry.is_dir() if want_dir else entry.is_file()):
+            lines.append(f"✅ {kind} exists: {path}")
         else:
-            print(f"❌ File missing: {file_name}")
+            lines.append(f"❌ {kind} missing: {path}")
             all_good = False
+            if fast:
+                break
 
+    print("\n".join(lines))
     return all_good
 
 
+def parse_env_file(path):
+    """Parse KEY=value lines from an env file into a dict, skipping comments."""
+    env = {}
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#') or '=' not in line:
+                continue
+            key, value = line.split('=', 1)
+            env[key.strip()] = value.strip()
+    return env
+
+
 def test_configuration():
     """Test if configuration is properly set up."""
     print("\nTesting configuration...")
@@ -96,23 +113,23 @@ def test_configuration():
         print("✅ .env file exists")
 
         # Check if it has required variables
-        with open('.env', 'r') as f:
-            content = f.read()
-
-            required_vars = [
-                'AWS_REGION', 'AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY',
-                'SMTP_SERVER', 'SMTP_PORT', 'SMTP_EMAIL', 'SMTP_PASSWORD'
-            ]
-
-            all_set = True
-            for var in required_vars:
-                if var in content and 'your_' not in content.split(var)[1].split('\n')[0]:
-                    print(f"✅ {var} is configured")
-                else:
-                    print(f"⚠️  {var} needs to be configured in .env")
-                    all_set = False
-
-            return all_set
+        env = parse_env_file('.env')
+
+        required_vars = [
+            'AWS_REGION', 'AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY',
+            'SMTP_SERVER', 'SMTP_PORT', 'SMTP_EMAIL', 'SMTP_PASSWORD'
+        ]
+
+        all_set = True
+        for var in required_vars:
+            value = env.get(var, '')
+            if value and 'your_' not in value:
+                print(f"✅ {var} is configured")
+            else:
+                print(f"⚠️  {var} needs to be configured in .env")
+                all_set = False
+
+        return all_set
     else:
         print("❌ .env file not found. Copy .env.example to .env and configure it.")
         return False
@@ -135,6 +152,14 @@ def test_database():
         # Test basic operations
         db = DatabaseManager(test_db_path)
 
+        # Text that looks like a JSON list must come back unchanged
+        fields = {'title': '[2024]', 'category': 'Innovation'}
+        existing_pub = db.get_all_publications()[0]
+        submission = db.create_submission(existing_pub.id, 'test@test.com', 'Test Project', fields)
+        if db.get_submission_fields(submission.id) != fields:
+            raise AssertionError("Submission fields did not round-trip")
+        print("✅ Submission fields round-trip")
+
         # Test publication creation
         pub = db.create_publication(2026, 1, 'first_half')
         print(f"✅ Created test publication: {pub.get_display_name()}")
@@ -155,6 +180,31 @@ def test_database():
         return False
 
 
+def test_sanitizer():
+    """Test that HTML sanitizing keeps plain text and strips dangerous markup."""
+    print("\nTesting HTML sanitizer...")
+
+    from utils.validators import sanitize_html_content
+
+    cases = [
+        ('R&D &amp; QA', 'R&D &amp; QA'),
+        ('a < b', 'a < b'),
+        ('<b onclick="x()">Hi</b><script>alert(1)</script>', '<b>Hi</b>'),
+        ('<iframe src="https://example.com"></iframe>ok', 'ok'),
+    ]
+
+    all_good = True
+    for content, expected in cases:
+        result = sanitize_html_content(content)
+        if result == expected:
+            print(f"✅ {content!r} -> {result!r}")
+        else:
+            print(f"❌ {content!r} -> {result!r} (expected {expected!r})")
+            all_good = False
+
+    return all_good
+
+
 def test_aws_bedrock():
     """Test AWS Bedrock connectivity (optional)."""
     print("\nTesting AWS Bedrock (optional)...")
@@ -178,7 +228,9 @@ def test_aws_bedrock():
 
 
 def main():
-    """Run all tests."""
+    """Run all tests. Pass ``--fast`` to stop the structure check at the first gap."""
+    fast = '--fast' in sys.argv[1:]
+
     print("=" * 60)
     print("Organizational Spotlight - Setup Verification")
     print("=" * 60)
@@ -186,9 +238,10 @@ def main():
     results = []
 
     results.append(("Imports", test_imports()))
-    results.append(("Project Structure", test_project_structure()))
+    results.append(("Project Structure", test_project_structure(fast)))
     results.append(("Configuration", test_configuration()))
     results.append(("Database", test_database()))
+    results.append(("HTML Sanitizer", test_sanitizer()))
     results.append(("AWS Bedrock", test_aws_bedrock()))
 
     print("\n" + "=" * 60)
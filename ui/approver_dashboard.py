@@ -3,23 +3,70 @@ Approver dashboard for reviewing and publishing organizational spotlights.
 """
 
 import streamlit as st
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 from database.db_manager import DatabaseManager
-from services.ai_service import get_ai_service
 from services.publication_service import PublicationService
-from services.email_service import get_email_service
 from config import settings
 from utils.validators import validate_form_submission
 from ui.components import (
     render_page_header, render_submission_form, render_ai_comparison,
     render_html_preview, render_success_message, render_error_message,
-    render_info_message, render_status_badge, render_metric_cards,
+    render_info_message, render_publication_list, render_submission_fields,
+    submission_cache, clear_submission_caches,
     render_loading_spinner, render_confirmation_dialog
 )
 
 
+@st.cache_resource
+def _pub_service(_db_manager: DatabaseManager) -> PublicationService:
+    """Publication service shared across reruns and sessions."""
+    return PublicationService(_db_manager)
+
+
+@st.cache_resource
+def _ai_service():
+    """AI service shared across reruns and sessions."""
+    # Imported on first use so pages without AI features don't load it
+    from services.ai_service import get_ai_service
+    return get_ai_service()
+
+
+@st.cache_resource
+def _email_service():
+    """Email service shared across reruns and sessions."""
+    from services.email_service import get_email_service
+    return get_email_service()
+
+
+@submission_cache
+@st.cache_data(ttl=30, show_spinner=False)
+def _pubs_with_counts(_db_manager: DatabaseManager, status: str,
+                      pub_statuses: Optional[Tuple[str, ...]] = None) -> List[Tuple[int, str, int]]:
+    """
+    List publications that have submissions in a given status.
+
+    Cleared through clear_submission_caches whenever a submission is created,
+    edited or reviewed, or a publication is published.
+
+    Args:
+        _db_manager: Database manager instance (not part of the cache key)
+        status: Submission status to count
+        pub_statuses: Optional publication statuses to restrict to
+
+    Returns:
+        List of (publication ID, display name, submission count) tuples
+    """
+    counts = _db_manager.count_submissions_per_publication(status)
+
+    return [
+        (pub.id, pub.get_display_name(), counts[pub.id])
+        for pub in _db_manager.get_all_publications()
+        if pub.id in counts and (pub_statuses is None or pub.status in pub_statuses)
+    ]
+
+
 def show_approver_dashboard(db_manager: DatabaseManager, user_email: str, user_name: str):
     """
     Display the main approver dashboard.
@@ -30,7 +77,7 @@ def show_approver_dashboard(db_manager: DatabaseManager, user_email: str, user_n
         user_name: Current user's name
     """
     # Initialize services
-    pub_service = PublicationService(db_manager)
+    pub_service = _pub_service(db_manager)
 
     # Sidebar navigation
     st.sidebar.markdown("### Navigation")
@@ -64,27 +111,20 @@ def show_review_queue_page(db_manager: DatabaseManager,
         "Review submitted spotlights and approve for publication"
     )
 
-    # Get all publications with submitted items
-    all_pubs = pub_service.get_all_publications()
-
-    # Filter publications with submissions
-    pubs_with_submissions = []
-    for pub in all_pubs:
-        submitted = db_manager.get_submissions_by_publication(pub.id, status='submitted')
-        if submitted:
-            pubs_with_submissions.append((pub, len(submitted)))
+    # Publications with submitted items
+    pubs_with_submissions = _pubs_with_counts(db_manager, 'submitted')
 
     if not pubs_with_submissions:
         render_info_message("No submissions awaiting review.")
         return
 
     # Select publication
-    pub_options = {f"{pub.get_display_name()} ({count} pending)": pub.id
-                   for pub, count in pubs_with_submissions}
+    pub_options = {f"{display_name} ({count} pending)": pub_id
+                   for pub_id, display_name, count in pubs_with_submissions}
 
     selected_pub_name = st.selectbox(
         "Select Publication",
-        options=list(pub_options.keys())
+        options=pub_options
     )
 
     selected_pub_id = pub_options[selected_pub_name]
@@ -99,9 +139,11 @@ def show_review_queue_page(db_manager: DatabaseManager,
 
     st.markdown(f"### {len(submissions)} Submissions Awaiting Review")
 
+    fields_by_id = db_manager.get_submission_fields_bulk([s.id for s in submissions])
+
     # Display submissions
     for idx, submission in enumerate(submissions):
-        fields = db_manager.get_submission_fields(submission.id)
+        fields = fields_by_id.get(submission.id, {})
 
         with st.expander(
             f"Submission #{submission.id}: {fields.get('title', 'Untitled')}",
@@ -115,6 +157,49 @@ def show_review_queue_page(db_manager: DatabaseManager,
             )
 
 
+@st.cache_data(ttl=600, max_entries=8, show_spinner=False)
+def _render_email_preview(publication, submissions: List[Dict[str, Any]]) -> str:
+    """
+    Render the publication email for preview, reusing output for unchanged input.
+
+    Args:
+        publication: Publication object
+        submissions: Submission dictionaries as built by ``_email_submissions``
+
+    Returns:
+        Rendered HTML string
+    """
+    return _email_service().render_email_html(publication, submissions)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _year_options() -> Tuple[int, int, int]:
+    """Return last, current and next year; refreshed hourly to follow the calendar."""
+    year = datetime.now().year
+    return year - 1, year, year + 1
+
+
+def _email_submissions(submissions, fields_by_id: Dict[int, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Build the per-submission data passed to the email renderer.
+
+    Only called from the preview and publish handlers, so ordinary reruns of
+    the publish page don't assemble it.
+
+    Args:
+        submissions: Submissions to include
+        fields_by_id: Submission fields keyed on submission ID
+
+    Returns:
+        List of dictionaries with project name and fields for each submission
+    """
+    return [
+        {'project_name': submission.project_name, **fields_by_id.get(submission.id, {})}
+        for submission in submissions
+    ]
+
+
+@st.fragment
 def show_submission_review(db_manager: DatabaseManager,
                           submission,
                           fields: Dict[str, str],
@@ -122,12 +207,19 @@ def show_submission_review(db_manager: DatabaseManager,
     """
     Display submission review interface.
 
+    Runs as a fragment: editing, previewing and AI suggestions rerun only this
+    submission. Approving, rejecting and saving rerun the whole page so the
+    queue and the submission's fields are reloaded.
+
     Args:
         db_manager: Database manager instance
         submission: Submission object
         fields: Submission fields dictionary
         reviewer_email: Reviewer's email
     """
+    ai_key = f'ai_suggestions_{submission.id}'
+    preview_key = f'show_preview_{submission.id}'
+
     # Show submission details
     col1, col2 = st.columns([2, 1])
 
@@ -138,29 +230,23 @@ def show_submission_review(db_manager: DatabaseManager,
     with col2:
         st.markdown(f"**Submitted:** {submission.submitted_at.strftime('%Y-%m-%d %H:%M')}")
 
-    st.markdown("---")
-
-    # Display fields
-    for field_name, field_value in fields.items():
-        if field_value:
-            st.markdown(f"**{field_name.replace('_', ' ').title()}:**")
-            st.write(field_value)
-
-    st.markdown("---")
+    # Display fields; the border sets them apart from the details and actions
+    with st.container(border=True):
+        render_submission_fields(fields)
 
     # Edit option
-    if st.checkbox(f"Edit Submission", key=f"edit_check_{submission.id}"):
+    if st.checkbox("Edit Submission", key=f"edit_check_{submission.id}"):
         st.markdown("### Edit Submission")
 
         # Allow editing
-        edited_fields = render_submission_form(settings.FORM_FIELDS, fields)
+        edited_fields = render_submission_form(settings.get_form_fields(), fields)
 
         # Get AI suggestions for edited content
         col1, col2 = st.columns([1, 3])
 
         with col1:
             if st.button("Get AI Suggestions", key=f"ai_{submission.id}"):
-                ai_service = get_ai_service()
+                ai_service = _ai_service()
 
                 submission_data = {
                     'project_name': submission.project_name,
@@ -168,22 +254,23 @@ def show_submission_review(db_manager: DatabaseManager,
                 }
 
                 with render_loading_spinner("Generating AI suggestions..."):
-                    suggestions = ai_service.generate_suggestions(submission_data)
+                    suggestions = ai_service.generate_suggestions_with_retry(submission_data)
 
                     if suggestions:
-                        st.session_state[f'ai_suggestions_{submission.id}'] = suggestions
+                        st.session_state[ai_key] = suggestions
                         render_success_message("AI suggestions generated!")
-                        st.rerun()
+                        st.rerun(scope="fragment")
 
         # Show AI suggestions if available
-        if f'ai_suggestions_{submission.id}' in st.session_state:
+        if ai_key in st.session_state:
+            ai_suggestions = st.session_state[ai_key]
             original = {k: v for k, v in edited_fields.items()
-                       if k in st.session_state[f'ai_suggestions_{submission.id}'] and v}
+                       if k in ai_suggestions and v}
 
-            render_ai_comparison(original, st.session_state[f'ai_suggestions_{submission.id}'])
+            render_ai_comparison(original, ai_suggestions)
 
             if st.button("Accept AI Suggestions", key=f"accept_ai_{submission.id}", type="primary"):
-                for key, value in st.session_state[f'ai_suggestions_{submission.id}'].items():
+                for key, value in ai_suggestions.items():
                     if key in edited_fields:
                         edited_fields[key] = value
 
@@ -193,6 +280,7 @@ def show_submission_review(db_manager: DatabaseManager,
         if st.button("Save Changes", key=f"save_{submission.id}"):
             try:
                 db_manager.update_submission_fields(submission.id, edited_fields)
+                clear_submission_caches()
                 render_success_message("Changes saved successfully!")
                 st.rerun()
             except Exception as e:
@@ -200,9 +288,9 @@ def show_submission_review(db_manager: DatabaseManager,
 
     # Preview
     if st.button("Preview", key=f"preview_{submission.id}"):
-        st.session_state[f'show_preview_{submission.id}'] = True
+        st.session_state[preview_key] = True
 
-    if st.session_state.get(f'show_preview_{submission.id}', False):
+    if st.session_state.get(preview_key, False):
         preview_data = {
             'project_name': submission.project_name,
             **fields
@@ -234,6 +322,7 @@ def show_submission_review(db_manager: DatabaseManager,
                 'approved',
                 reviewed_by=reviewer_email
             )
+            clear_submission_caches()
             render_success_message(f"Submission #{submission.id} approved!")
             st.rerun()
         except Exception as e:
@@ -253,6 +342,7 @@ def show_submission_review(db_manager: DatabaseManager,
                     'rejected',
                     reviewed_by=reviewer_email
                 )
+                clear_submission_caches()
                 render_success_message(f"Submission #{submission.id} rejected.")
                 st.rerun()
             except Exception as e:
@@ -274,9 +364,7 @@ def show_all_publications_page(db_manager: DatabaseManager,
     )
 
     # Year filter
-    current_year = datetime.now().year
-    year_options = [current_year - 1, current_year, current_year + 1]
-    selected_year = st.selectbox("Filter by year", options=year_options, index=1)
+    selected_year = st.selectbox("Filter by year", options=_year_options(), index=1)
 
     # Get publications for selected year
     publications = pub_service.get_all_publications(selected_year)
@@ -286,32 +374,10 @@ def show_all_publications_page(db_manager: DatabaseManager,
         return
 
     # Display publications
-    for pub in publications:
-        stats = pub_service.get_publication_stats(pub.id)
-
-        with st.container():
-            col1, col2, col3 = st.columns([3, 1, 2])
-
-            with col1:
-                st.markdown(f"### {pub.get_display_name()}")
-
-            with col2:
-                render_status_badge(pub.status)
-
-            with col3:
-                st.markdown(f"**Total Submissions:** {stats['total']}")
-
-            # Show detailed stats
-            if stats['total'] > 0:
-                metric_data = {
-                    "Draft": stats['draft'],
-                    "Submitted": stats['submitted'],
-                    "Approved": stats['approved'],
-                    "Rejected": stats['rejected']
-                }
-                render_metric_cards(metric_data)
-
-            st.markdown("---")
+    render_publication_list(
+        publications,
+        pub_service.get_publication_stats_for_year(selected_year)
+    )
 
 
 def show_publish_page(db_manager: DatabaseManager,
@@ -331,26 +397,19 @@ def show_publish_page(db_manager: DatabaseManager,
     )
 
     # Get publications with approved submissions
-    all_pubs = pub_service.get_all_publications()
-
-    pubs_ready = []
-    for pub in all_pubs:
-        if pub.status in ['open', 'under_review']:
-            approved = db_manager.get_submissions_by_publication(pub.id, status='approved')
-            if approved:
-                pubs_ready.append((pub, len(approved)))
+    pubs_ready = _pubs_with_counts(db_manager, 'approved', ('open', 'under_review'))
 
     if not pubs_ready:
         render_info_message("No publications with approved submissions ready to publish.")
         return
 
     # Select publication
-    pub_options = {f"{pub.get_display_name()} ({count} approved)": pub.id
-                   for pub, count in pubs_ready}
+    pub_options = {f"{display_name} ({count} approved)": pub_id
+                   for pub_id, display_name, count in pubs_ready}
 
     selected_pub_name = st.selectbox(
         "Select Publication to Publish",
-        options=list(pub_options.keys())
+        options=pub_options
     )
 
     selected_pub_id = pub_options[selected_pub_name]
@@ -365,21 +424,13 @@ def show_publish_page(db_manager: DatabaseManager,
     st.markdown(f"### {len(approved_submissions)} Approved Submissions")
 
     # Display approved submissions
-    submissions_data = []
+    fields_by_id = db_manager.get_submission_fields_bulk([s.id for s in approved_submissions])
 
     for submission in approved_submissions:
-        fields = db_manager.get_submission_fields(submission.id)
-
-        submissions_data.append({
-            'project_name': submission.project_name,
-            **fields
-        })
+        fields = fields_by_id.get(submission.id, {})
 
         with st.expander(f"{fields.get('title', 'Untitled')} - {submission.project_name}"):
-            for field_name, field_value in fields.items():
-                if field_value:
-                    st.markdown(f"**{field_name.replace('_', ' ').title()}:**")
-                    st.write(field_value)
+            render_submission_fields(fields)
 
     st.markdown("---")
 
@@ -398,12 +449,10 @@ def show_publish_page(db_manager: DatabaseManager,
     if st.button("Preview Email"):
         st.markdown("### Email Preview")
 
-        email_service = get_email_service()
-
         try:
-            html_content = email_service.render_email_html(
+            html_content = _render_email_preview(
                 selected_pub,
-                submissions_data
+                _email_submissions(approved_submissions, fields_by_id)
             )
 
             st.components.v1.html(html_content, height=800, scrolling=True)
@@ -437,20 +486,21 @@ def show_publish_page(db_manager: DatabaseManager,
         st.markdown("### Confirm Publication")
 
         if st.button("Yes, Publish Now", type="primary"):
-            email_service = get_email_service()
+            email_service = _email_service()
 
             with render_loading_spinner("Publishing and sending email..."):
                 try:
                     # Send email
                     email_sent = email_service.send_publication_email(
                         selected_pub,
-                        submissions_data,
+                        _email_submissions(approved_submissions, fields_by_id),
                         recipients
                     )
 
                     if email_sent:
                         # Update publication status
                         pub_service.publish_publication(selected_pub_id)
+                        clear_submission_caches()
 
                         st.session_state['confirm_publish'] = False
 
@@ -2,19 +2,71 @@
 Reusable UI components for the Streamlit application.
 """
 
+import os
 import streamlit as st
-from typing import Dict, Any, List, Optional
-from jinja2 import Template
-from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
-from config import settings
 from config.branding import BMS_COLORS, STATUS_COLORS, FONTS
 from utils.helpers import (
-    get_status_badge_color, get_status_display_name,
-    format_datetime, truncate_text
+    get_status_display_name,
+    format_datetime, format_field_name, load_template
 )
 
 
+# Header and sidebar fragments; branding values are baked in, text filled per call
+_PAGE_TITLE = f'<h1 style="font-family: {FONTS["heading"]}; color: {BMS_COLORS["text_primary"]};">{{}}</h1>'
+_PAGE_SUBTITLE = f'<p style="font-family: {FONTS["regular"]}; color: {BMS_COLORS["text_secondary"]}; font-size: 16px;">{{}}</p>'
+_SIDEBAR_WELCOME = f'<div style="font-family: {FONTS["bold"]}; font-size: 18px; color: {BMS_COLORS["text_primary"]};">Welcome, {{}}</div>'
+_BADGE = (
+    '<span class="bms-badge" style="background-color: {color}; color: white; '
+    f'font-family: {FONTS["bold"]};">{{name}}</span>'
+)
+_PUBLICATION_LIST_CARD = (
+    '<div class="bms-card">'
+    '<div style="display: flex; justify-content: space-between; align-items: center;">'
+    f'<h3 style="font-family: {FONTS["heading"]}; color: {BMS_COLORS["text_primary"]}; margin: 0;">{{name}}</h3>'
+    '{badge}</div>'
+    f'<p style="font-family: {FONTS["regular"]}; color: {BMS_COLORS["text_secondary"]}; margin: 10px 0 0 0;">'
+    '<b>Total Submissions:</b> {total}{breakdown}</p>'
+    '</div>'
+)
+_SIDEBAR_ROLE = f'<div style="font-family: {FONTS["regular"]}; color: {BMS_COLORS["text_secondary"]};">Role: {{}}</div>'
+
+
+# Cached submission queries shared by both dashboards, cleared together
+_SUBMISSION_CACHES: List[Callable] = []
+
+
+def submission_cache(cached_func: Callable) -> Callable:
+    """
+    Register an ``st.cache_data`` function to be cleared by clear_submission_caches.
+
+    Args:
+        cached_func: Function already wrapped by ``st.cache_data``
+
+    Returns:
+        The same function
+    """
+    _SUBMISSION_CACHES.append(cached_func)
+    return cached_func
+
+
+def clear_submission_caches():
+    """Clear every registered submission cache, for all sessions."""
+    for cached_func in _SUBMISSION_CACHES:
+        cached_func.clear()
+
+
+@lru_cache(maxsize=64)
+def _badge_html(status: str) -> str:
+    """Build the status badge markup; there are only a handful of statuses."""
+    display_name = get_status_display_name(status)
+    hex_color = STATUS_COLORS.get(status.lower(), '#6c757d')
+
+    return _BADGE.format(color=hex_color, name=display_name)
+
+
 def render_status_badge(status: str):
     """
     Render a colored status badge with BMS styling.
@@ -22,16 +74,125 @@ def render_status_badge(status: str):
     Args:
         status: Status string
     """
-    display_name = get_status_display_name(status)
-    hex_color = STATUS_COLORS.get(status.lower(), '#6c757d')
+    st.markdown(_badge_html(status), unsafe_allow_html=True)
 
-    st.markdown(
-        f'<span class="bms-badge" style="background-color: {hex_color}; color: white; '
-        f'font-family: {FONTS["bold"]};">{display_name}</span>',
-        unsafe_allow_html=True
+
+def _render_text_field(label: str, initial_value: Any, field: Dict[str, Any], help_text: str):
+    """Render a single-line text input."""
+    return st.text_input(
+        label,
+        value=initial_value,
+        placeholder=field.get('placeholder', ''),
+        help=help_text
+    )
+
+
+def _render_textarea_field(label: str, initial_value: Any, field: Dict[str, Any], help_text: str):
+    """Render a multi-line text area."""
+    return st.text_area(
+        label,
+        value=initial_value,
+        placeholder=field.get('placeholder', ''),
+        help=help_text,
+        height=150
+    )
+
+
+def _render_select_field(label: str, initial_value: Any, field: Dict[str, Any], help_text: str):
+    """Render a single-choice select box, preselecting the initial value."""
+    options = field.get('options', [])
+    index = 0
+    if initial_value and initial_value in options:
+        index = options.index(initial_value)
+    return st.selectbox(
+        label,
+        options=options,
+        index=index,
+        help=help_text
+    )
+
+
+@lru_cache(maxsize=256)
+def _split_csv(value: str) -> Tuple[str, ...]:
+    """Split a comma-separated string into stripped items."""
+    return tuple(v.strip() for v in value.split(','))
+
+
+def _render_multiselect_field(label: str, initial_value: Any, field: Dict[str, Any], help_text: str):
+    """Render a multi-choice select, accepting a list or comma-separated initial value."""
+    default = []
+    if initial_value:
+        if isinstance(initial_value, list):
+            default = initial_value
+        elif isinstance(initial_value, str):
+            default = list(_split_csv(initial_value))
+    return st.multiselect(
+        label,
+        options=field.get('options', []),
+        default=default,
+        help=help_text
     )
 
 
+def _render_fallback_field(label: str, initial_value: Any, field: Dict[str, Any], help_text: str):
+    """Render an unknown field type as a plain text input."""
+    return st.text_input(label, value=initial_value, help=help_text)
+
+
+# Widget renderer for each form field type
+_FIELD_RENDERERS = {
+    'text': _render_text_field,
+    'textarea': _render_textarea_field,
+    'select': _render_select_field,
+    'multiselect': _render_multiselect_field,
+}
+
+
+class _FieldSpec(NamedTuple):
+    """A form field resolved for rendering."""
+    name: str
+    label: str
+    help_text: str
+    render: Callable[..., Any]
+    field: Dict[str, Any]
+
+
+# Last compiled form schema, as (fields_config, specs); holding the config
+# keeps its id from being reused while cached
+_form_schema_cache: Optional[Tuple[List[Dict[str, Any]], Tuple[_FieldSpec, ...]]] = None
+
+
+def _compile_form_schema(fields_config: List[Dict[str, Any]]) -> Tuple[_FieldSpec, ...]:
+    """
+    Resolve labels, help text and renderers for a form field configuration.
+
+    The configuration from settings.get_form_fields() is the same object on
+    every rerun, so it is compiled once and reused until a different list is
+    passed.
+
+    Args:
+        fields_config: List of field configuration dictionaries
+
+    Returns:
+        Tuple of field specs in form order
+    """
+    global _form_schema_cache
+    if _form_schema_cache is None or _form_schema_cache[0] is not fields_config:
+        specs = tuple(
+            _FieldSpec(
+                name=field['name'],
+                # Asterisk marks required fields
+                label=f"{field['label']} *" if field.get('required', False) else field['label'],
+                help_text=field.get('help_text', ''),
+                render=_FIELD_RENDERERS.get(field['type'], _render_fallback_field),
+                field=field
+            )
+            for field in fields_config
+        )
+        _form_schema_cache = (fields_config, specs)
+    return _form_schema_cache[1]
+
+
 def render_submission_form(fields_config: List[Dict[str, Any]],
                           initial_values: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
@@ -49,66 +210,13 @@ def render_submission_form(fields_config: List[Dict[str, Any]],
     if initial_values is None:
         initial_values = {}
 
-    for field in fields_config:
-        field_name = field['name']
-        field_label = field['label']
-        field_type = field['type']
-        is_required = field.get('required', False)
-        placeholder = field.get('placeholder', '')
-        help_text = field.get('help_text', '')
-
-        # Add asterisk for required fields
-        label = f"{field_label} {'*' if is_required else ''}"
-
-        # Get initial value
-        initial_value = initial_values.get(field_name, '')
-
-        # Render appropriate input widget
-        if field_type == 'text':
-            value = st.text_input(
-                label,
-                value=initial_value,
-                placeholder=placeholder,
-                help=help_text
-            )
-        elif field_type == 'textarea':
-            value = st.text_area(
-                label,
-                value=initial_value,
-                placeholder=placeholder,
-                help=help_text,
-                height=150
-            )
-        elif field_type == 'select':
-            options = field.get('options', [])
-            index = 0
-            if initial_value and initial_value in options:
-                index = options.index(initial_value)
-            value = st.selectbox(
-                label,
-                options=options,
-                index=index,
-                help=help_text
-            )
-        elif field_type == 'multiselect':
-            options = field.get('options', [])
-            default = []
-            if initial_value:
-                if isinstance(initial_value, list):
-                    default = initial_value
-                elif isinstance(initial_value, str):
-                    default = [v.strip() for v in initial_value.split(',')]
-            value = st.multiselect(
-                label,
-                options=options,
-                default=default,
-                help=help_text
-            )
-        else:
-            # Default to text input
-            value = st.text_input(label, value=initial_value, help=help_text)
-
-        form_data[field_name] = value
+    for spec in _compile_form_schema(fields_config):
+        form_data[spec.name] = spec.render(
+            spec.label,
+            initial_values.get(spec.name, ''),
+            spec.field,
+            spec.help_text
+        )
 
     return form_data
 
@@ -125,7 +233,7 @@ def render_ai_comparison(original: Dict[str, str], suggested: Dict[str, str]):
 
     for field_name, original_value in original.items():
         if field_name in suggested:
-            st.markdown(f"**{field_name.replace('_', ' ').title()}**")
+            st.markdown(f"**{format_field_name(field_name)}**")
 
             col1, col2 = st.columns(2)
 
@@ -140,6 +248,22 @@ def render_ai_comparison(original: Dict[str, str], suggested: Dict[str, str]):
             st.markdown("---")
 
 
+@st.cache_data(max_entries=32, show_spinner=False)
+def _render_preview_html(template_path: str, mtime: float, submission_data: Dict[str, Any]) -> str:
+    """
+    Render the preview template, reusing output for unchanged data.
+
+    Args:
+        template_path: Path to the preview template
+        mtime: Modification time of the template, so edits invalidate the cache
+        submission_data: Dictionary containing submission data
+
+    Returns:
+        Rendered HTML string
+    """
+    return load_template(template_path).render(**submission_data)
+
+
 def render_html_preview(submission_data: Dict[str, str],
                        template_path: str = 'templates/preview_template.html'):
     """
@@ -150,11 +274,9 @@ def render_html_preview(submission_data: Dict[str, str],
         template_path: Path to the preview template
     """
     try:
-        with open(template_path, 'r', encoding='utf-8') as f:
-            template_content = f.read()
-
-        template = Template(template_content)
-        html = template.render(**submission_data)
+        html = _render_preview_html(
+            template_path, os.stat(template_path).st_mtime, submission_data
+        )
 
         st.components.v1.html(html, height=800, scrolling=True)
 
@@ -188,39 +310,63 @@ def render_publication_card(publication, submission_count: int = 0):
             st.markdown(f"Published: {format_datetime(publication.published_at)}")
 
 
-def render_submission_card(submission, fields: Dict[str, str], show_actions: bool = False):
+def render_publication_list(publications: List[Any], stats_by_pub: Dict[int, Dict[str, int]]):
     """
-    Render a submission card.
+    Render publication cards with submission counts as a single element.
 
     Args:
-        submission: Submission object
-        fields: Dictionary of submission fields
-        show_actions: Whether to show action buttons
-    """
-    with st.expander(f"{fields.get('title', 'Untitled')} - {submission.project_name}"):
-        col1, col2 = st.columns([3, 1])
+        publications: Publication objects to list
+        stats_by_pub: Publication stats keyed on publication ID, as returned by
+            PublicationService.get_publication_stats_for_year; publications
+            missing from it are shown with no submissions
+    """
+    cards = []
+    for publication in publications:
+        stats = stats_by_pub.get(publication.id)
+        breakdown = ''
+        if stats and stats['total'] > 0:
+            breakdown = (
+                f" &middot; Draft {stats['draft']} &middot; Submitted {stats['submitted']}"
+                f" &middot; Approved {stats['approved']} &middot; Rejected {stats['rejected']}"
+            )
+        cards.append(_PUBLICATION_LIST_CARD.format(
+            name=publication.get_display_name(),
+            badge=_badge_html(publication.status),
+            total=stats['total'] if stats else 0,
+            breakdown=breakdown
+        ))
 
-        with col1:
-            st.markdown(f"**Submitted by:** {submission.user_email}")
-            st.markdown(f"**Status:**")
-            render_status_badge(submission.status)
+    st.markdown(''.join(cards), unsafe_allow_html=True)
 
-        with col2:
-            st.markdown(f"**Created:** {format_datetime(submission.created_at)}")
 
-        st.markdown("---")
+@st.cache_data(max_entries=256, show_spinner=False)
+def _submission_fields_markdown(fields: Dict[str, Any]) -> str:
+    """
+    Build a submission's field listing as one markdown block.
+
+    Args:
+        fields: Dictionary of submission fields
 
-        # Show field values
-        for field_name, field_value in fields.items():
-            if field_value:
-                st.markdown(f"**{field_name.replace('_', ' ').title()}:**")
-                st.write(truncate_text(field_value, 200))
+    Returns:
+        Markdown with a bold label and value per non-empty field
+    """
+    sections = []
+    for field_name, field_value in fields.items():
+        if field_value:
+            if isinstance(field_value, list):
+                field_value = ', '.join(field_value)
+            sections.append(f"**{format_field_name(field_name)}:**\n\n{field_value}")
+    return '\n\n'.join(sections)
 
-        if show_actions:
-            st.markdown("---")
-            return st.button(f"Review Submission #{submission.id}", key=f"review_{submission.id}")
 
-    return False
+def render_submission_fields(fields: Dict[str, Any]):
+    """
+    Render a submission's non-empty fields, each under a bold label.
+
+    Args:
+        fields: Dictionary of submission fields
+    """
+    st.markdown(_submission_fields_markdown(fields))
 
 
 def render_metric_cards(metrics: Dict[str, Any]):
@@ -230,11 +376,8 @@ def render_metric_cards(metrics: Dict[str, Any]):
     Args:
         metrics: Dictionary of metrics {label: value}
     """
-    cols = st.columns(len(metrics))
-
-    for col, (label, value) in zip(cols, metrics.items()):
-        with col:
-            st.metric(label, value)
+    for col, (label, value) in zip(st.columns(len(metrics)), metrics.items()):
+        col.metric(label, value)
 
 
 def render_success_message(message: str, icon: str = ""):
@@ -291,13 +434,13 @@ def render_page_header(title: str, subtitle: str = None, icon: str = None):
         icon: Optional icon (ignored for professional look)
     """
     st.markdown(
-        f'<h1 style="font-family: {FONTS["heading"]}; color: {BMS_COLORS["text_primary"]};">{title}</h1>',
+        _PAGE_TITLE.format(title),
         unsafe_allow_html=True
     )
 
     if subtitle:
         st.markdown(
-            f'<p style="font-family: {FONTS["regular"]}; color: {BMS_COLORS["text_secondary"]}; font-size: 16px;">{subtitle}</p>',
+            _PAGE_SUBTITLE.format(subtitle),
             unsafe_allow_html=True
         )
 
@@ -313,11 +456,11 @@ def render_sidebar_navigation(user_role: str, user_name: str):
         user_name: User's name
     """
     st.sidebar.markdown(
-        f'<div style="font-family: {FONTS["bold"]}; font-size: 18px; color: {BMS_COLORS["text_primary"]};">Welcome, {user_name}</div>',
+        _SIDEBAR_WELCOME.format(user_name),
         unsafe_allow_html=True
     )
     st.sidebar.markdown(
-        f'<div style="font-family: {FONTS["regular"]}; color: {BMS_COLORS["text_secondary"]};">Role: {user_role.title()}</div>',
+        _SIDEBAR_ROLE.format(user_role.title()),
         unsafe_allow_html=True
     )
     st.sidebar.markdown("---")
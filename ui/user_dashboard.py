@@ -2,23 +2,82 @@
 User dashboard for submitting organizational spotlights.
 """
 
+import hashlib
+import json
 import streamlit as st
-from typing import Dict, Any, Optional
+from collections import Counter, OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 from database.db_manager import DatabaseManager
-from services.ai_service import get_ai_service
+from database.models import Submission
 from services.publication_service import PublicationService
 from config import settings
-from utils.validators import validate_form_submission, validate_project_name
+from utils.helpers import merge_dictionaries_view
+from utils.validators import validate_form_submission
 from ui.components import (
     render_page_header, render_submission_form, render_ai_comparison,
     render_html_preview, render_project_selector, render_success_message,
     render_error_message, render_info_message, render_status_badge,
-    render_submission_card, render_loading_spinner, render_metric_cards
+    render_submission_fields, render_loading_spinner, render_metric_cards,
+    submission_cache, clear_submission_caches
 )
 
 
+# Distinct submission contents whose AI suggestions are kept per session
+_AI_SUGGESTION_CACHE_SIZE = 8
+
+
+@st.cache_resource
+def _pub_service(_db_manager: DatabaseManager) -> PublicationService:
+    """Publication service shared across reruns and sessions."""
+    return PublicationService(_db_manager)
+
+
+@st.cache_resource
+def _ai_service():
+    """AI service shared across reruns and sessions."""
+    from services.ai_service import get_ai_service
+    return get_ai_service()
+
+
+@submission_cache
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_user_submissions(_db_manager: DatabaseManager,
+                           user_email: str) -> List[Tuple[Submission, Dict[str, Any], str]]:
+    """
+    Load a user's submissions with their fields and publication names.
+
+    Cleared through clear_submission_caches whenever a submission is created,
+    edited or reviewed, or a publication is published.
+
+    Args:
+        _db_manager: Database manager instance (not part of the cache key)
+        user_email: User's email
+
+    Returns:
+        List of (submission, fields, publication display name) tuples, newest first
+    """
+    return [
+        (submission, fields, publication.get_display_name())
+        for submission, fields, publication in _db_manager.get_user_submissions_with_details(user_email)
+    ]
+
+
+def _submission_hash(submission_data: Dict[str, Any]) -> str:
+    """
+    Hash submission content so identical AI requests can be recognised.
+
+    Args:
+        submission_data: Submission fields sent to the AI service
+
+    Returns:
+        Hex digest of the canonical JSON encoding
+    """
+    payload = json.dumps(submission_data, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
 def show_user_dashboard(db_manager: DatabaseManager, user_email: str, user_name: str):
     """
     Display the main user dashboard.
@@ -29,11 +88,14 @@ def show_user_dashboard(db_manager: DatabaseManager, user_email: str, user_name:
         user_name: Current user's name
     """
     # Initialize services
-    pub_service = PublicationService(db_manager)
-    ai_service = get_ai_service()
+    pub_service = _pub_service(db_manager)
+    ai_service = _ai_service()
 
-    # Ensure current year publications exist
-    pub_service.ensure_current_year_publications()
+    # Ensure current year publications exist, once per session and year
+    current_year = datetime.now().year
+    if st.session_state.get('_pubs_ensured_year') != current_year:
+        pub_service.ensure_current_year_publications()
+        st.session_state['_pubs_ensured_year'] = current_year
 
     # Sidebar navigation
     st.sidebar.markdown("### Navigation")
@@ -91,6 +153,11 @@ def show_new_submission_page(db_manager: DatabaseManager,
     if 'show_preview' not in st.session_state:
         st.session_state.show_preview = False
 
+    # Most recent successful AI suggestions for this session, keyed by
+    # submission hash, oldest first
+    if not isinstance(st.session_state.get('ai_suggestion_cache'), OrderedDict):
+        st.session_state.ai_suggestion_cache = OrderedDict()
+
     # Step 1: Project Selection
     st.markdown("## Step 1: Select Project")
     project_name = render_project_selector(settings.PROJECT_NAMES)
@@ -104,7 +171,7 @@ def show_new_submission_page(db_manager: DatabaseManager,
     st.markdown("*Fields marked with * are required*")
 
     form_data = render_submission_form(
-        settings.FORM_FIELDS,
+        settings.get_form_fields(),
         st.session_state.form_data
     )
 
@@ -122,7 +189,7 @@ def show_new_submission_page(db_manager: DatabaseManager,
     with col1:
         if st.button("Get AI Suggestions", type="primary"):
             # Validate form first
-            is_valid, errors = validate_form_submission(form_data, settings.FORM_FIELDS)
+            is_valid, errors = validate_form_submission(form_data, settings.get_form_fields_by_name())
 
             if not is_valid:
                 render_error_message("Please fix the following errors:")
@@ -135,11 +202,25 @@ def show_new_submission_page(db_manager: DatabaseManager,
                     **form_data
                 }
 
-                # Get AI suggestions
+                # Reuse suggestions for unchanged content; otherwise show the
+                # reply as it streams in
+                content_hash = _submission_hash(submission_data)
+                suggestions = st.session_state.ai_suggestion_cache.get(content_hash)
+
                 with render_loading_spinner("Generating AI suggestions..."):
-                    suggestions = ai_service.generate_suggestions(submission_data)
+                    if suggestions is None:
+                        stream_placeholder = st.empty()
+                        suggestions = ai_service.generate_suggestions_stream(
+                            submission_data, stream_placeholder.code
+                        )
+                        stream_placeholder.empty()
 
                     if suggestions:
+                        cache = st.session_state.ai_suggestion_cache
+                        cache[content_hash] = suggestions
+                        cache.move_to_end(content_hash)
+                        while len(cache) > _AI_SUGGESTION_CACHE_SIZE:
+                            cache.popitem(last=False)
                         st.session_state.ai_suggestions = suggestions
                         render_success_message("AI suggestions generated successfully!")
                     else:
@@ -203,15 +284,11 @@ def show_new_submission_page(db_manager: DatabaseManager,
         save_draft_button = st.button("Save as Draft")
 
     if submit_button or save_draft_button:
-        # Validate form
-        is_valid, errors = validate_form_submission(form_data, settings.FORM_FIELDS)
-
-        # Validate project name
-        proj_valid, proj_error = validate_project_name(project_name, settings.PROJECT_NAMES)
-
-        if not proj_valid:
-            errors.append(proj_error)
-            is_valid = False
+        # Validate form and project name in one pass
+        is_valid, errors = validate_form_submission(
+            merge_dictionaries_view(form_data, {'project_name': project_name}),
+            settings.get_submission_fields_by_name()
+        )
 
         if not is_valid:
             render_error_message("Please fix the following errors:")
@@ -220,30 +297,32 @@ def show_new_submission_page(db_manager: DatabaseManager,
         else:
             # Create submission
             try:
-                submission = db_manager.create_submission(
-                    publication_id=active_pub.id,
-                    user_email=user_email,
-                    project_name=project_name,
-                    fields=form_data
-                )
-
-                # Update status based on button clicked
-                status = 'submitted' if submit_button else 'draft'
-                db_manager.update_submission_status(submission.id, status)
-
-                # Save AI suggestions if they were generated and accepted
-                if st.session_state.ai_suggestions:
-                    original_content = {
-                        'project_name': project_name,
-                        **form_data
-                    }
-                    db_manager.save_ai_suggestion(
-                        submission.id,
-                        original_content,
-                        st.session_state.ai_suggestions,
-                        accepted=True
+                # Create with its final status and attach suggestions in one commit
+                with db_manager.transaction():
+                    submission = db_manager.create_submission(
+                        publication_id=active_pub.id,
+                        user_email=user_email,
+                        project_name=project_name,
+                        fields=form_data,
+                        # Status based on button clicked
+                        status='submitted' if submit_button else 'draft'
                     )
 
+                    # Save AI suggestions if they were generated and accepted
+                    if st.session_state.ai_suggestions:
+                        original_content = {
+                            'project_name': project_name,
+                            **form_data
+                        }
+                        db_manager.save_ai_suggestion(
+                            submission.id,
+                            original_content,
+                            st.session_state.ai_suggestions,
+                            accepted=True
+                        )
+
+                clear_submission_caches()
+
                 # Clear session state
                 st.session_state.form_data = {}
                 st.session_state.ai_suggestions = None
@@ -280,26 +359,17 @@ def show_my_submissions_page(db_manager: DatabaseManager, user_email: str):
     )
 
     # Get user's submissions
-    submissions = db_manager.get_submissions_by_user(user_email)
+    user_submissions = _load_user_submissions(db_manager, user_email)
 
-    if not submissions:
+    if not user_submissions:
         render_info_message("You haven't created any submissions yet.")
         return
 
     # Show metrics
-    status_counts = {
-        'draft': 0,
-        'submitted': 0,
-        'approved': 0,
-        'rejected': 0
-    }
-
-    for sub in submissions:
-        if sub.status in status_counts:
-            status_counts[sub.status] += 1
+    status_counts = Counter(submission.status for submission, _, _ in user_submissions)
 
     render_metric_cards({
-        "Total": len(submissions),
+        "Total": len(user_submissions),
         "Drafts": status_counts['draft'],
         "Submitted": status_counts['submitted'],
         "Approved": status_counts['approved'],
@@ -314,17 +384,12 @@ def show_my_submissions_page(db_manager: DatabaseManager, user_email: str):
         options=['All', 'Draft', 'Submitted', 'Approved', 'Rejected']
     )
 
-    # Display submissions
-    for submission in submissions:
-        if filter_status != 'All' and submission.status != filter_status.lower():
-            continue
-
-        # Get submission fields
-        fields = db_manager.get_submission_fields(submission.id)
-
-        # Get publication info
-        publication = db_manager.get_publication(submission.publication_id)
+    if filter_status != 'All':
+        wanted = filter_status.lower()
+        user_submissions = [entry for entry in user_submissions if entry[0].status == wanted]
 
+    # Display submissions
+    for submission, fields, publication_name in user_submissions:
         with st.expander(
             f"{fields.get('title', 'Untitled')} - {submission.project_name}",
             expanded=False
@@ -332,8 +397,8 @@ def show_my_submissions_page(db_manager: DatabaseManager, user_email: str):
             col1, col2 = st.columns([2, 1])
 
             with col1:
-                st.markdown(f"**Publication:** {publication.get_display_name()}")
-                st.markdown(f"**Status:**")
+                st.markdown(f"**Publication:** {publication_name}")
+                st.markdown("**Status:**")
                 render_status_badge(submission.status)
 
             with col2:
@@ -344,10 +409,7 @@ def show_my_submissions_page(db_manager: DatabaseManager, user_email: str):
             st.markdown("---")
 
             # Show fields
-            for field_name, field_value in fields.items():
-                if field_value:
-                    st.markdown(f"**{field_name.replace('_', ' ').title()}:**")
-                    st.write(field_value)
+            render_submission_fields(fields)
 
             # Action buttons for drafts
             if submission.status == 'draft':
@@ -20,8 +20,10 @@ from utils.helpers import (
     get_current_period,
     format_field_name,
     merge_dictionaries,
+    merge_dictionaries_view,
     get_month_name,
-    count_words
+    count_words,
+    load_template
 )
 
 __all__ = [
@@ -41,6 +43,8 @@ __all__ = [
     'get_current_period',
     'format_field_name',
     'merge_dictionaries',
+    'merge_dictionaries_view',
     'get_month_name',
-    'count_words'
+    'count_words',
+    'load_template'
 ]
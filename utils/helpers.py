@@ -2,8 +2,78 @@
 Utility helper functions.
 """
 
+import os
+import re
+from collections import ChainMap
 from datetime import datetime
-from typing import Dict, Any, List
+from functools import lru_cache
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict, Any, List
+
+if TYPE_CHECKING:
+    from jinja2 import Template
+
+
+_STATUS_BADGE_COLORS = {
+    'draft': 'gray',
+    'submitted': 'blue',
+    'under_review': 'orange',
+    'approved': 'green',
+    'rejected': 'red',
+    'published': 'purple',
+    'open': 'green'
+}
+
+_STATUS_DISPLAY_NAMES = {
+    'draft': 'Draft',
+    'submitted': 'Submitted',
+    'under_review': 'Under Review',
+    'approved': 'Approved',
+    'rejected': 'Rejected',
+    'published': 'Published',
+    'open': 'Open'
+}
+
+_MONTH_NAMES = (
+    'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December'
+)
+
+_NAME_VALUE = itemgetter('name', 'value')
+
+_WORD_RE = re.compile(r'\S+')
+
+
+@lru_cache(maxsize=8)
+def _compile_template(template_path: str, mtime: float) -> 'Template':
+    """
+    Read and compile a Jinja2 template.
+
+    Args:
+        template_path: Path to the template file
+        mtime: Modification time of the file, so edits invalidate the cache
+
+    Returns:
+        Compiled template
+    """
+    # Jinja is only needed once a template is rendered
+    from jinja2 import Template
+
+    with open(template_path, 'r', encoding='utf-8') as f:
+        return Template(f.read())
+
+
+def load_template(template_path: str) -> 'Template':
+    """
+    Get a compiled Jinja2 template, recompiling only when the file changes.
+
+    Args:
+        template_path: Path to the template file
+
+    Returns:
+        Compiled template
+    """
+    return _compile_template(template_path, os.stat(template_path).st_mtime)
 
 
 def format_date(dt: datetime, format_str: str = '%B %d, %Y') -> str:
@@ -48,16 +118,7 @@ def get_status_badge_color(status: str) -> str:
     Returns:
         Color name or hex code
     """
-    status_colors = {
-        'draft': 'gray',
-        'submitted': 'blue',
-        'under_review': 'orange',
-        'approved': 'green',
-        'rejected': 'red',
-        'published': 'purple',
-        'open': 'green'
-    }
-    return status_colors.get(status.lower(), 'gray')
+    return _STATUS_BADGE_COLORS.get(status.lower(), 'gray')
 
 
 def get_status_display_name(status: str) -> str:
@@ -70,16 +131,7 @@ def get_status_display_name(status: str) -> str:
     Returns:
         Display name
     """
-    status_names = {
-        'draft': 'Draft',
-        'submitted': 'Submitted',
-        'under_review': 'Under Review',
-        'approved': 'Approved',
-        'rejected': 'Rejected',
-        'published': 'Published',
-        'open': 'Open'
-    }
-    return status_names.get(status.lower(), status.title())
+    return _STATUS_DISPLAY_NAMES.get(status.lower(), status.title())
 
 
 def truncate_text(text: str, max_length: int = 100, suffix: str = '...') -> str:
@@ -126,7 +178,7 @@ def fields_to_dict(fields: List[Dict[str, str]]) -> Dict[str, str]:
     Returns:
         Dictionary
     """
-    return {field['name']: field['value'] for field in fields}
+    return dict(map(_NAME_VALUE, fields))
 
 
 def get_current_period() -> tuple:
@@ -146,10 +198,14 @@ def get_current_period() -> tuple:
     return year, month, period
 
 
+@lru_cache(maxsize=256)
 def format_field_name(field_name: str) -> str:
     """
     Format a field name for display (convert snake_case to Title Case).
 
+    Cached, since the same handful of form field names is formatted for every
+    submission on every rerun.
+
     Args:
         field_name: Field name in snake_case
 
@@ -175,6 +231,21 @@ def merge_dictionaries(*dicts: Dict) -> Dict:
     return result
 
 
+def merge_dictionaries_view(*dicts: Dict) -> ChainMap:
+    """
+    Read-only merged view of several dictionaries, without copying them.
+
+    Later dictionaries take precedence, as in merge_dictionaries.
+
+    Args:
+        *dicts: Variable number of dictionaries to merge
+
+    Returns:
+        ChainMap looking keys up in the dictionaries from last to first
+    """
+    return ChainMap(*reversed(dicts))
+
+
 def get_month_name(month: int) -> str:
     """
     Get the full name of a month.
@@ -185,12 +256,8 @@ def get_month_name(month: int) -> str:
     Returns:
         Month name
     """
-    month_names = [
-        'January', 'February', 'March', 'April', 'May', 'June',
-        'July', 'August', 'September', 'October', 'November', 'December'
-    ]
     if 1 <= month <= 12:
-        return month_names[month - 1]
+        return _MONTH_NAMES[month - 1]
     return f"Month {month}"
 
 
@@ -206,4 +273,5 @@ def count_words(text: str) -> int:
     """
     if not text:
         return 0
-    return len(text.split())
+    # Count matches without materializing a list of words
+    return sum(1 for _ in _WORD_RE.finditer(text))
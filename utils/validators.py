@@ -2,8 +2,119 @@
 Input validation utilities.
 """
 
+import html
 import re
-from typing import Dict, List, Any, Tuple
+from html.parser import HTMLParser
+from typing import AbstractSet, Any, Dict, List, Mapping, Sequence, Tuple, Union
+
+
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Markup kept by sanitize_html_content; other tags are stripped but their
+# text is kept, except inside the dropped elements
+_ALLOWED_TAGS = frozenset({
+    'b', 'i', 'u', 'strong', 'em', 'p', 'br', 'ul', 'ol', 'li', 'a', 'span'
+})
+_ALLOWED_ATTRIBUTES = {'a': frozenset({'href', 'title'})}
+_DROPPED_ELEMENTS = frozenset({'script', 'style'})
+
+# Whitespace and control characters browsers ignore inside a URL scheme
+_URL_IGNORED_RE = re.compile(r'[\x00-\x20]+')
+
+# Source text of an entity or character reference, with its ';' if it had one
+_REFERENCE_RE = re.compile(r'&#?[0-9A-Za-z]+;?')
+
+# A '<' that starts something tag-like; only reaches the text path when the
+# tag is left unterminated at the end of the input
+_TAG_OPEN_RE = re.compile(r'<(?=[A-Za-z/!?])')
+
+
+def _is_safe_attribute(tag: str, name: str, value: str) -> bool:
+    """Allow only listed attributes, and no javascript: URLs."""
+    if name not in _ALLOWED_ATTRIBUTES.get(tag, ()):
+        return False
+    if value is None:
+        return True
+    return not _URL_IGNORED_RE.sub('', html.unescape(value)).lower().startswith('javascript:')
+
+
+class _HTMLSanitizer(HTMLParser):
+    """Single-pass sanitizer that keeps allowlisted markup and the original text."""
+
+    def __init__(self, source: str):
+        super().__init__(convert_charrefs=False)
+        self.parts: List[str] = []
+        self._dropping = 0
+        self._source = source
+        # Offset of each line in the source, to map getpos() to an index
+        self._line_starts = [0] + [m.end() for m in re.finditer('\n', source)]
+
+    def _source_index(self) -> int:
+        """Index in the source of the construct being handled."""
+        lineno, offset = self.getpos()
+        return self._line_starts[lineno - 1] + offset
+
+    def _emit_tag(self, tag: str, attrs, closing: str):
+        if tag in _DROPPED_ELEMENTS:
+            if not closing:
+                self._dropping += 1
+            return
+        if self._dropping or tag not in _ALLOWED_TAGS:
+            return
+        rendered = ''.join(
+            f' {name}' if value is None else f' {name}="{html.escape(value)}"'
+            for name, value in attrs
+            if _is_safe_attribute(tag, name, value)
+        )
+        self.parts.append(f'<{tag}{rendered}{closing}>')
+
+    def handle_starttag(self, tag, attrs):
+        self._emit_tag(tag, attrs, '')
+
+    def handle_startendtag(self, tag, attrs):
+        self._emit_tag(tag, attrs, ' /')
+
+    def handle_endtag(self, tag):
+        if tag in _DROPPED_ELEMENTS:
+            self._dropping = max(0, self._dropping - 1)
+        elif not self._dropping and tag in _ALLOWED_TAGS:
+            self.parts.append(f'</{tag}>')
+
+    def _emit_text(self, data: str, start: int):
+        """Emit text as written, escaping any '<' that would open a tag."""
+        end = start + len(data)
+        # Look one character past the data, since a lone '<' arrives on its own
+        cuts = [m.start() - start for m in _TAG_OPEN_RE.finditer(self._source, start, end + 1)
+                if m.start() < end]
+        last = 0
+        for cut in cuts:
+            self.parts.append(data[last:cut])
+            self.parts.append('&lt;')
+            last = cut + 1
+        self.parts.append(data[last:])
+
+    def handle_data(self, data):
+        if not self._dropping:
+            self._emit_text(data, self._source_index())
+
+    def _emit_reference(self):
+        if not self._dropping:
+            self.parts.append(_REFERENCE_RE.match(self._source, self._source_index()).group())
+
+    def handle_entityref(self, name):
+        self._emit_reference()
+
+    def handle_charref(self, name):
+        self._emit_reference()
+
+    def close(self):
+        # HTMLParser's end-of-input flush drops a trailing '&' ("R&D"), so
+        # whatever is still unparsed is emitted here as text instead
+        tail = self.rawdata
+        self.rawdata = ''
+        if tail and not self._dropping:
+            self._emit_text(tail, len(self._source) - len(tail))
+        super().close()
 
 
 def validate_email(email: str) -> Tuple[bool, str]:
@@ -19,8 +130,7 @@ def validate_email(email: str) -> Tuple[bool, str]:
     if not email:
         return False, "Email is required"
 
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    if not re.match(pattern, email):
+    if not _EMAIL_RE.match(email):
         return False, "Invalid email format"
 
     return True, ""
@@ -72,67 +182,87 @@ def validate_text_length(text: str, field_name: str,
     return True, ""
 
 
-def validate_form_submission(fields: Dict[str, Any],
-                            field_config: List[Dict[str, Any]]) -> Tuple[bool, List[str]]:
+def _validate_select(value: Any, field_label: str, config: Mapping[str, Any]) -> Tuple[bool, str]:
+    """Check that a select value is one of the configured options."""
+    options = config.get('_options_set')
+    if options is None:
+        options = config.get('options', [])
+    if value not in options:
+        return False, f"{field_label} must be one of the available options"
+    return True, ""
+
+
+def _validate_multiselect(value: Any, field_label: str, config: Mapping[str, Any]) -> Tuple[bool, str]:
+    """Check that a multiselect value is a list."""
+    if not isinstance(value, list):
+        return False, f"{field_label} must be a list"
+    return True, ""
+
+
+def _validate_project(value: Any, field_label: str, config: Mapping[str, Any]) -> Tuple[bool, str]:
+    """Check a project name against the configured project set, if any."""
+    return validate_project_name(value, config.get('_options_set'))
+
+
+# Per-type validator, called as validator(value, field_label, field_config)
+_TYPE_VALIDATORS = {
+    'text': lambda value, label, config: validate_text_length(value, label, 0, 200),
+    'textarea': lambda value, label, config: validate_text_length(value, label, 0, 5000),
+    'select': _validate_select,
+    'multiselect': _validate_multiselect,
+    'project': _validate_project,
+}
+
+
+def validate_form_submission(fields: Mapping[str, Any],
+                            field_config: Union[Sequence[Mapping[str, Any]],
+                                                Mapping[str, Mapping[str, Any]]]
+                            ) -> Tuple[bool, List[str]]:
     """
     Validate a complete form submission.
 
     Args:
         fields: Dictionary of field values
-        field_config: List of field configuration dictionaries
+        field_config: List of field configuration dictionaries, or a mapping
+            of field name to configuration (see settings.get_form_fields_by_name)
 
     Returns:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
 
+    if isinstance(field_config, Mapping):
+        field_config = field_config.values()
+
     for config in field_config:
-        field_name = config['name']
         field_label = config['label']
         is_required = config.get('required', False)
-        field_type = config.get('type', 'text')
-
-        value = fields.get(field_name)
+        value = fields.get(config['name'])
 
-        # Check required fields
         if is_required:
             is_valid, error = validate_required_field(value, field_label)
             if not is_valid:
                 errors.append(error)
                 continue
-
-        # Skip validation for empty optional fields
-        if not value and not is_required:
+        elif not value:
+            # Skip validation for empty optional fields
             continue
 
-        # Validate text fields
-        if field_type in ['text', 'textarea']:
-            if field_type == 'text':
-                is_valid, error = validate_text_length(value, field_label, 0, 200)
-            else:  # textarea
-                is_valid, error = validate_text_length(value, field_label, 0, 5000)
-
+        validator = _TYPE_VALIDATORS.get(config.get('type', 'text'))
+        if validator is not None:
+            is_valid, error = validator(value, field_label, config)
             if not is_valid:
                 errors.append(error)
 
-        # Validate select fields
-        elif field_type == 'select':
-            options = config.get('options', [])
-            if value not in options:
-                errors.append(f"{field_label} must be one of the available options")
-
-        # Validate multiselect fields
-        elif field_type == 'multiselect':
-            if not isinstance(value, list):
-                errors.append(f"{field_label} must be a list")
-
     return len(errors) == 0, errors
 
 
 def sanitize_html_content(content: str) -> str:
     """
     Sanitize HTML content to prevent XSS attacks.
-    Removes potentially dangerous HTML tags and attributes.
+    Keeps only allowlisted tags (with href/title on links, minus javascript:
+    URLs), drops script and style elements with their content and strips
+    comments, in one parse. Text and entity references are left as written.
 
     Args:
         content: HTML content to sanitize
@@ -140,25 +270,23 @@ def sanitize_html_content(content: str) -> str:
     Returns:
         Sanitized content
     """
-    # Remove script tags
-    content = re.sub(r'<script[^>]*>.*?</script>', '', content, flags=re.DOTALL | re.IGNORECASE)
-
-    # Remove javascript: protocols
-    content = re.sub(r'javascript:', '', content, flags=re.IGNORECASE)
-
-    # Remove on* event handlers
-    content = re.sub(r'\son\w+\s*=', '', content, flags=re.IGNORECASE)
+    content = content or ''
+    sanitizer = _HTMLSanitizer(content)
+    sanitizer.feed(content)
+    sanitizer.close()
 
-    return content
+    return ''.join(sanitizer.parts)
 
 
-def validate_project_name(project_name: str, available_projects: List[str] = None) -> Tuple[bool, str]:
+def validate_project_name(project_name: str,
+                          available_projects: Union[List[str], AbstractSet[str]] = None) -> Tuple[bool, str]:
     """
     Validate project name.
 
     Args:
         project_name: Project name to validate
-        available_projects: List of valid project names (None for manual entry only)
+        available_projects: Valid project names, ideally a set such as
+            settings.PROJECT_NAMES_SET (None for manual entry only)
 
     Returns:
         Tuple of (is_valid, error_message)